@@ -4,6 +4,8 @@ This module provides CuvisNodeAdapter - a NodeGraphQt BaseNode subclass
 that wraps cuvis-ai node information for visual editing.
 """
 
+from collections import defaultdict
+from functools import lru_cache
 from typing import Any
 
 from NodeGraphQt import BaseNode
@@ -47,6 +49,25 @@ CATEGORY_COLORS: dict[str, tuple[int, int, int, int]] = {
 DEFAULT_NODE_COLOR = (100, 100, 100, 255)  # Default gray
 
 
+@lru_cache(maxsize=1024)
+def _category_for_path(full_path: str) -> str:
+    """Infer the registry category for a node class path.
+
+    Cached, since the same paths are categorized again on every palette refresh.
+
+    Args:
+        full_path: Full class import path
+
+    Returns:
+        Title-cased category name, or "Other" if no category keyword matches
+    """
+    path = full_path.lower()
+    for category in CATEGORY_COLORS:
+        if category in path:
+            return category.title()
+    return "Other"
+
+
 class CuvisNodeAdapter(BaseNode):
     """NodeGraphQt adapter for cuvis-ai nodes.
 
@@ -431,23 +452,12 @@ class NodeRegistry:
         Returns:
             Dictionary mapping category -> list of node infos
         """
-        categories: dict[str, list[dict[str, Any]]] = {}
+        categories: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
 
         for info in self._nodes.values():
-            # Infer category from path
-            path = info.get("full_path", "").lower()
-            category = "Other"
-
-            for cat in CATEGORY_COLORS.keys():
-                if cat in path:
-                    category = cat.title()
-                    break
-
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(info)
+            categories[_category_for_path(info.get("full_path", ""))].append(info)
 
-        return categories
+        return dict(categories)
 
     def register_with_graph(self, graph: Any) -> int:
         """Register all node classes with a NodeGraphQt graph.
@@ -1,55 +1,116 @@
 """Node palette widget for browsing and selecting nodes.
 
-This module provides a searchable tree widget that displays available
+This module provides a searchable tree view that displays available
 cuvis-ai nodes organized by category/plugin. Users can drag nodes
 from the palette onto the graph canvas to create new node instances.
 """
 
+from collections.abc import Iterable
 from typing import Any
 
 from loguru import logger
 from NodeGraphQt import NodeGraph
-from PySide6.QtCore import QMimeData, Qt, Signal
-from PySide6.QtGui import QDrag
+from PySide6.QtCore import QMimeData, QModelIndex, QSortFilterProxyModel, Qt, QTimer, Signal
+from PySide6.QtGui import QDrag, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QHBoxLayout,
     QLineEdit,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
 from ..adapters import NodeRegistry, PortSpec
 
+# Item data role holding the text a node row is matched against
+SEARCH_ROLE = Qt.ItemDataRole.UserRole + 1
 
-class NodePaletteItem(QTreeWidgetItem):
-    """Tree item representing a node type.
+# Delay (ms) after the last keystroke before the search filter is applied
+SEARCH_DEBOUNCE_MS = 150
+
+# Normalized port spec: (name, dtype, shape, optional). The name is None for
+# PortSpec objects, which do not carry their port name.
+SpecTuple = tuple[str | None, Any, Any, bool]
+
+
+def _as_spec_tuple(spec: dict[str, Any] | PortSpec) -> SpecTuple:
+    """Normalize a dict (from gRPC) or PortSpec port spec to a tuple.
+
+    Args:
+        spec: Port spec in either supported format
+
+    Returns:
+        Spec tuple (name, dtype, shape, optional)
+    """
+    if isinstance(spec, dict):
+        return (
+            spec.get("name", ""),
+            spec.get("dtype", "any"),
+            spec.get("shape", ()),
+            spec.get("optional", False),
+        )
+    return (None, spec.dtype, spec.shape, spec.optional)
+
+
+def _spec_tuples(specs: Iterable[Any]) -> tuple[SpecTuple, ...]:
+    """Normalize a list of port specs, skipping unsupported entries."""
+    return tuple(_as_spec_tuple(spec) for spec in specs if isinstance(spec, (dict, PortSpec)))
+
+
+def _format_spec_line(spec: SpecTuple, show_optional: bool = False) -> str:
+    """Format one normalized port spec as a tooltip line.
+
+    Args:
+        spec: Spec tuple (name, dtype, shape, optional)
+        show_optional: Whether to mark optional ports
+
+    Returns:
+        Tooltip line, e.g. "  - cube: float32 (opt)"
+    """
+    name, dtype, _shape, optional = spec
+    label = f"{dtype}" if name is None else f"{name or '?'}: {dtype}"
+    opt_str = " (opt)" if show_optional and optional else ""
+    return f"  - {label}{opt_str}"
+
+
+class NodePaletteItem(QStandardItem):
+    """Model item representing a node type.
 
     Stores the node info dictionary for drag-and-drop creation.
     """
 
-    def __init__(
-        self,
-        parent: QTreeWidgetItem | QTreeWidget,
-        node_info: dict[str, Any],
-    ) -> None:
+    # Keep per-item attributes out of the instance __dict__ (palettes hold many items)
+    __slots__ = ("_inputs", "_outputs", "_search_key", "node_info")
+
+    def __init__(self, node_info: dict[str, Any]) -> None:
         """Initialize the item.
 
         Args:
-            parent: Parent tree item or widget
             node_info: Node information dictionary
         """
-        super().__init__(parent)
+        super().__init__()
         self.node_info = node_info
 
         # Display name
         class_name = node_info.get("class_name", "Unknown")
-        self.setText(0, class_name)
+        self.setText(class_name)
+        self.setEditable(False)
+
+        # Port specs, normalized once for the search key and tooltip
+        self._inputs = _spec_tuples(node_info.get("input_specs", ()))
+        self._outputs = _spec_tuples(node_info.get("output_specs", ()))
+
+        # Lowercased text matched by the palette search filter
+        port_names = [spec[0] for spec in (*self._inputs, *self._outputs) if spec[0]]
+        self._search_key = " ".join(
+            [class_name, node_info.get("full_path", ""), *port_names]
+        ).lower()
+        self.setData(self._search_key, SEARCH_ROLE)
 
         # Tooltip with details
-        self.setToolTip(0, self._format_tooltip())
+        self.setToolTip(self._format_tooltip())
 
     def _format_tooltip(self) -> str:
         """Format a detailed tooltip for the node."""
@@ -63,31 +124,14 @@ class NodePaletteItem(QTreeWidgetItem):
         lines.append("")
 
         # Input specs
-        input_specs = info.get("input_specs", [])
-        if input_specs:
+        if self._inputs:
             lines.append("<b>Inputs:</b>")
-            for spec in input_specs:
-                if isinstance(spec, dict):
-                    name = spec.get("name", "?")
-                    dtype = spec.get("dtype", "any")
-                    optional = spec.get("optional", False)
-                    opt_str = " (opt)" if optional else ""
-                    lines.append(f"  - {name}: {dtype}{opt_str}")
-                elif isinstance(spec, PortSpec):
-                    opt_str = " (opt)" if spec.optional else ""
-                    lines.append(f"  - {spec.dtype}{opt_str}")
+            lines.extend([_format_spec_line(spec, show_optional=True) for spec in self._inputs])
 
         # Output specs
-        output_specs = info.get("output_specs", [])
-        if output_specs:
+        if self._outputs:
             lines.append("<b>Outputs:</b>")
-            for spec in output_specs:
-                if isinstance(spec, dict):
-                    name = spec.get("name", "?")
-                    dtype = spec.get("dtype", "any")
-                    lines.append(f"  - {name}: {dtype}")
-                elif isinstance(spec, PortSpec):
-                    lines.append(f"  - {spec.dtype}")
+            lines.extend([_format_spec_line(spec) for spec in self._outputs])
 
         # Source info
         source = info.get("source", "")
@@ -102,12 +146,41 @@ class NodePaletteItem(QTreeWidgetItem):
         return "<br>".join(lines)
 
 
+class NodeFilterProxyModel(QSortFilterProxyModel):
+    """Proxy model filtering node rows by their search text.
+
+    Category rows carry no search text, so they are only shown while at
+    least one of their node rows matches (recursive filtering). The search
+    text is stored lowercased, so the filter string must be lowercased too.
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        """Initialize the proxy model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.setRecursiveFilteringEnabled(True)
+        self.setFilterRole(SEARCH_ROLE)
+        self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseSensitive)
+
+    def set_search(self, needle: str) -> None:
+        """Filter node rows by a lowercased search string.
+
+        Args:
+            needle: Lowercased search text
+        """
+        # Always re-runs the filter, even if the string itself is unchanged
+        self.setFilterFixedString(needle)
+
+
 class NodePalette(QWidget):
     """Searchable tree widget for browsing available nodes.
 
     Features:
     - Tree view organized by category/plugin
-    - Search filter with real-time filtering
+    - Search filter applied as the user types (debounced)
     - Drag-and-drop to create nodes on canvas
     - Refresh button to reload from server
 
@@ -137,6 +210,12 @@ class NodePalette(QWidget):
         self._registry = node_registry
         self._graph = graph
 
+        # Needle of the last applied search (None forces the next one to run)
+        self._last_needle: str | None = None
+
+        # Number of node rows passing the current search
+        self._visible_count = 0
+
         self._setup_ui()
         self._populate_tree()
 
@@ -150,9 +229,15 @@ class NodePalette(QWidget):
         search_layout = QHBoxLayout()
         search_layout.setSpacing(4)
 
+        # Coalesce bursts of keystrokes into a single filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
         self._search_input = QLineEdit()
         self._search_input.setPlaceholderText("Search nodes...")
-        self._search_input.textChanged.connect(self._on_search_changed)
+        self._search_input.textChanged.connect(self._filter_timer.start)
         self._search_input.setClearButtonEnabled(True)
         search_layout.addWidget(self._search_input)
 
@@ -163,12 +248,20 @@ class NodePalette(QWidget):
 
         layout.addLayout(search_layout)
 
-        # Tree widget
-        self._tree = QTreeWidget()
-        self._tree.setHeaderLabel("Available Nodes")
+        # Node model, filtered through a proxy for the search bar
+        self._model = QStandardItemModel(self)
+        self._model.setHorizontalHeaderLabels(["Available Nodes"])
+
+        self._proxy = NodeFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+
+        # Tree view
+        self._tree = QTreeView()
+        self._tree.setModel(self._proxy)
         self._tree.setDragEnabled(True)
-        self._tree.setDragDropMode(QTreeWidget.DragDropMode.DragOnly)
-        self._tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self._tree.setDragDropMode(QAbstractItemView.DragDropMode.DragOnly)
+        self._tree.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._tree.doubleClicked.connect(self._on_item_double_clicked)
 
         # Enable custom drag handling
         self._tree.startDrag = self._start_drag  # type: ignore
@@ -177,7 +270,7 @@ class NodePalette(QWidget):
 
     def _populate_tree(self) -> None:
         """Populate the tree with nodes from the registry."""
-        self._tree.clear()
+        self._model.removeRows(0, self._model.rowCount())
 
         # Group nodes by category
         categories = self._registry.get_nodes_by_category()
@@ -194,81 +287,64 @@ class NodePalette(QWidget):
                 continue
 
             # Create category item
-            cat_item = QTreeWidgetItem(self._tree)
-            cat_item.setText(0, f"{category} ({len(nodes)})")
-            cat_item.setFlags(cat_item.flags() & ~Qt.ItemFlag.ItemIsDragEnabled)
+            cat_item = QStandardItem(f"{category} ({len(nodes)})")
+            cat_item.setEditable(False)
+            cat_item.setDragEnabled(False)
+
+            # Add node items in one batch
+            items = [
+                NodePaletteItem(node_info)
+                for node_info in sorted(nodes, key=lambda n: n.get("class_name", ""))
+            ]
+            cat_item.appendRows(items)
+
+            self._model.appendRow(cat_item)
+
+        # Re-apply the active search against the new items
+        self._last_needle = None
+        self._apply_filter()
+
+    def _apply_filter(self) -> None:
+        """Apply the current search text to the tree."""
+        needle = self._search_input.text().strip().lower()
+        if needle == self._last_needle:
+            return
+        self._last_needle = needle
 
-            # Add node items
-            for node_info in sorted(nodes, key=lambda n: n.get("class_name", "")):
-                NodePaletteItem(cat_item, node_info)
+        self._proxy.set_search(needle)
+        self._tree.expandAll()
 
-            cat_item.setExpanded(True)
+        # Only categories are top-level rows, so this is O(categories)
+        proxy = self._proxy
+        self._visible_count = sum(
+            proxy.rowCount(proxy.index(row, 0)) for row in range(proxy.rowCount())
+        )
 
-    def _on_search_changed(self, text: str) -> None:
-        """Handle search text change.
+    def _item_from_index(self, index: QModelIndex) -> QStandardItem | None:
+        """Resolve a view (proxy) index to its model item.
 
         Args:
-            text: Search text
-        """
-        search_lower = text.lower().strip()
-
-        # Show all if empty
-        if not search_lower:
-            self._show_all_items()
-            return
+            index: Index from the tree view
 
-        # Filter items
-        for i in range(self._tree.topLevelItemCount()):
-            cat_item = self._tree.topLevelItem(i)
-            if cat_item is None:
-                continue
-
-            visible_count = 0
-            for j in range(cat_item.childCount()):
-                node_item = cat_item.child(j)
-                if node_item is None:
-                    continue
-
-                # Check if node matches search
-                if isinstance(node_item, NodePaletteItem):
-                    class_name = node_item.node_info.get("class_name", "").lower()
-                    full_path = node_item.node_info.get("full_path", "").lower()
-                    matches = search_lower in class_name or search_lower in full_path
-                else:
-                    matches = search_lower in node_item.text(0).lower()
-
-                node_item.setHidden(not matches)
-                if matches:
-                    visible_count += 1
-
-            # Hide category if no matches
-            cat_item.setHidden(visible_count == 0)
-            cat_item.setExpanded(True)
-
-    def _show_all_items(self) -> None:
-        """Show all items in the tree."""
-        for i in range(self._tree.topLevelItemCount()):
-            cat_item = self._tree.topLevelItem(i)
-            if cat_item is None:
-                continue
-            cat_item.setHidden(False)
-            for j in range(cat_item.childCount()):
-                child = cat_item.child(j)
-                if child:
-                    child.setHidden(False)
+        Returns:
+            Model item or None
+        """
+        if not index.isValid():
+            return None
+        return self._model.itemFromIndex(self._proxy.mapToSource(index))
 
     def _on_refresh_clicked(self) -> None:
         """Handle refresh button click."""
         self.refresh_requested.emit()
         self._populate_tree()
 
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int) -> None:
+    def _on_item_double_clicked(self, index: QModelIndex) -> None:
         """Handle item double-click.
 
         Args:
-            item: Clicked item
-            column: Clicked column
+            index: Clicked index
         """
+        item = self._item_from_index(index)
         if isinstance(item, NodePaletteItem):
             self.node_double_clicked.emit(item.node_info)
             self._create_node(item.node_info)
@@ -279,7 +355,7 @@ class NodePalette(QWidget):
         Args:
             supported_actions: Supported drop actions
         """
-        item = self._tree.currentItem()
+        item = self._item_from_index(self._tree.currentIndex())
         if not isinstance(item, NodePaletteItem):
             return
 
@@ -335,13 +411,21 @@ class NodePalette(QWidget):
         self._populate_tree()
         logger.info(f"Refreshed palette with {len(nodes)} nodes")
 
+    def visible_count(self) -> int:
+        """Get the number of nodes matching the current search.
+
+        Returns:
+            Number of visible node rows
+        """
+        return self._visible_count
+
     def get_selected_node_info(self) -> dict[str, Any] | None:
         """Get the currently selected node info.
 
         Returns:
             Node info dictionary or None
         """
-        item = self._tree.currentItem()
+        item = self._item_from_index(self._tree.currentIndex())
         if isinstance(item, NodePaletteItem):
             return item.node_info
         return None
@@ -9,6 +9,8 @@ This dialog allows users to view and edit pipeline metadata including:
 - Additional custom fields (read-only)
 """
 
+import copy
+import re
 from datetime import datetime
 from typing import Any
 
@@ -26,6 +28,9 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+# Separator between tags in the comma-separated tags field
+_TAG_SPLIT_RE = re.compile(r"\s*,\s*")
+
 
 class PipelineInfoDialog(QDialog):
     """Dialog for viewing and editing pipeline metadata.
@@ -54,15 +59,46 @@ class PipelineInfoDialog(QDialog):
         super().__init__(parent)
 
         self._metadata = metadata or {}
-        self._setup_ui()
-        self._load_metadata()
 
-    def _setup_ui(self) -> None:
-        """Setup the dialog UI."""
+        # get_metadata() result, reused until one of the fields is edited
+        self._metadata_cache: dict[str, Any] | None = None
+        self._metadata_dirty = True
+
+        # Form widgets are built on first show (or first get_metadata call)
+        self._ui_built = False
         self.setWindowTitle("Pipeline Information")
         self.setMinimumWidth(500)
         self.setMinimumHeight(400)
 
+    def _ensure_ui(self) -> None:
+        """Build the form and load the metadata into it, once."""
+        if self._ui_built:
+            return
+        self._ui_built = True
+
+        self._setup_ui()
+        self._load_metadata()
+
+        self._name_edit.textChanged.connect(self._mark_metadata_dirty)
+        self._author_edit.textChanged.connect(self._mark_metadata_dirty)
+        self._tags_edit.textChanged.connect(self._mark_metadata_dirty)
+        self._description_edit.textChanged.connect(self._mark_metadata_dirty)
+
+    def setVisible(self, visible: bool) -> None:
+        """Build the UI before the dialog is first shown.
+
+        Overriding setVisible rather than showEvent lets the dialog size
+        itself to the form before it appears.
+
+        Args:
+            visible: Whether the dialog should be visible
+        """
+        if visible:
+            self._ensure_ui()
+        super().setVisible(visible)
+
+    def _setup_ui(self) -> None:
+        """Setup the dialog UI."""
         layout = QVBoxLayout(self)
 
         # Main form layout
@@ -162,6 +198,10 @@ class PipelineInfoDialog(QDialog):
                 label.setWordWrap(True)
                 self._extra_fields_layout.addRow(f"{key}:", label)
 
+    def _mark_metadata_dirty(self, *_args: Any) -> None:
+        """Invalidate the cached metadata after a field edit."""
+        self._metadata_dirty = True
+
     def _on_accept(self) -> None:
         """Validate and accept the dialog."""
         # Validate name (required)
@@ -184,9 +224,12 @@ class PipelineInfoDialog(QDialog):
         Returns:
             Updated metadata dictionary
         """
+        self._ensure_ui()
+        if not self._metadata_dirty and self._metadata_cache is not None:
+            return copy.deepcopy(self._metadata_cache)
+
         # Parse tags (comma-separated)
-        tags_text = self._tags_edit.text().strip()
-        tags = [tag.strip() for tag in tags_text.split(",") if tag.strip()]
+        tags = [tag for tag in _TAG_SPLIT_RE.split(self._tags_edit.text().strip()) if tag]
 
         # Auto-generate created timestamp if not present
         created = self._metadata.get("created", "")
@@ -208,5 +251,7 @@ class PipelineInfoDialog(QDialog):
             if key not in standard_fields:
                 updated[key] = value
 
-        # Remove empty values
-        return {k: v for k, v in updated.items() if v}
+        # Remove empty values; callers get deep copies so they cannot alter the cache
+        self._metadata_cache = {k: v for k, v in updated.items() if v}
+        self._metadata_dirty = False
+        return copy.deepcopy(self._metadata_cache)
@@ -92,24 +92,24 @@ class PluginManagerDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Tab widget
-        tabs = QTabWidget()
-        layout.addWidget(tabs)
+        self._tab_widget = QTabWidget()
+        layout.addWidget(self._tab_widget)
 
         # Status tab
         status_widget = self._create_status_tab()
-        tabs.addTab(status_widget, "Loaded Plugins")
+        self._tab_widget.addTab(status_widget, "Loaded Plugins")
 
         # Git tab
         git_widget = self._create_git_tab()
-        tabs.addTab(git_widget, "Load from Git")
+        self._tab_widget.addTab(git_widget, "Load from Git")
 
         # Local tab
         local_widget = self._create_local_tab()
-        tabs.addTab(local_widget, "Load from Local")
+        self._tab_widget.addTab(local_widget, "Load from Local")
 
         # Manifest tab
         manifest_widget = self._create_manifest_tab()
-        tabs.addTab(manifest_widget, "Load from Manifest")
+        self._tab_widget.addTab(manifest_widget, "Load from Manifest")
 
         # Dialog buttons
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
@@ -136,13 +136,13 @@ class PluginManagerDialog(QDialog):
 
         # Actions
         actions_layout = QHBoxLayout()
-        refresh_btn = QPushButton("Refresh Status")
-        refresh_btn.clicked.connect(self._refresh_status)
-        actions_layout.addWidget(refresh_btn)
+        self._refresh_btn = QPushButton("Refresh Status")
+        self._refresh_btn.clicked.connect(self._refresh_status)
+        actions_layout.addWidget(self._refresh_btn)
 
-        remove_btn = QPushButton("Remove Selected")
-        remove_btn.clicked.connect(self._remove_selected_plugins)
-        actions_layout.addWidget(remove_btn)
+        self._remove_btn = QPushButton("Remove Selected")
+        self._remove_btn.clicked.connect(self._remove_selected_plugins)
+        actions_layout.addWidget(self._remove_btn)
 
         reset_btn = QPushButton("Reset to Defaults")
         reset_btn.clicked.connect(self._reset_to_defaults)
@@ -316,6 +316,17 @@ class PluginManagerDialog(QDialog):
             logger.error(f"Failed to refresh plugin status: {e}")
             QMessageBox.warning(self, "Warning", f"Failed to refresh plugin status:\n{e}")
 
+        self._populate_status_table(loaded_node_counts)
+
+        self._status_table.blockSignals(False)
+        self._is_refreshing = False
+
+    def _populate_status_table(self, loaded_node_counts: dict[str, int]) -> None:
+        """Fill the status table with one row per plugin entry.
+
+        Args:
+            loaded_node_counts: Number of server-side nodes per loaded plugin name
+        """
         self._status_table.setRowCount(len(self._plugin_entries))
         for row, entry in enumerate(self._plugin_entries):
             load_item = QTableWidgetItem()
@@ -360,9 +371,6 @@ class PluginManagerDialog(QDialog):
             provided_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
             self._status_table.setItem(row, STATUS_COL_PROVIDES, provided_item)
 
-        self._status_table.blockSignals(False)
-        self._is_refreshing = False
-
     def _on_status_item_changed(self, item: QTableWidgetItem) -> None:
         """Handle load checkbox toggles."""
         if self._is_refreshing:
@@ -1,8 +1,16 @@
 """Shared pytest fixtures for cuvis-ai-ui tests."""
 
+import copy
+import os
+
 import pytest
 from unittest.mock import Mock
-from PySide6.QtWidgets import QApplication
+
+# Render Qt offscreen unless the caller picked a platform (set before QApplication exists)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtGui import QFontMetrics
+from PySide6.QtWidgets import QApplication, QDialog, QTableWidget, QTabWidget
 
 from cuvis_ai_ui.adapters import NodeRegistry
 from cuvis_ai_ui.grpc.client import CuvisAIClient
@@ -10,10 +18,27 @@ from cuvis_ai_ui.grpc.client import CuvisAIClient
 
 @pytest.fixture(scope="session")
 def qapp():
-    """QApplication instance for Qt tests (session-scoped)."""
+    """QApplication instance for Qt tests (session-scoped).
+
+    Qt's style, font and widget caches are warmed up here so the first
+    dialog built in each (xdist worker) session does not pay for them.
+
+    Every xdist worker is its own process and so needs its own QApplication;
+    Qt tests are intentionally not pinned to one worker with xdist_group,
+    since almost every test depends on this fixture and the suite would
+    effectively run serially.
+    """
     app = QApplication.instance()
     if app is None:
         app = QApplication([])
+    app.setStyle("fusion")
+    QFontMetrics(app.font()).horizontalAdvance("Plugin Manager")
+
+    warmup = QDialog()
+    tabs = QTabWidget(warmup)
+    tabs.addTab(QTableWidget(1, 1), "Warmup")
+    del tabs, warmup
+
     yield app
 
 
@@ -27,40 +52,43 @@ def mock_grpc_client():
     return client
 
 
+SAMPLE_NODE_INFO = {
+    "class_name": "MinMaxNormalizer",
+    "full_path": "cuvis_ai.node.normalization.MinMaxNormalizer",
+    "source": "builtin",
+    "plugin_name": "",
+    "input_specs": [
+        {
+            "name": "cube",
+            "dtype": "float32",
+            "shape": "[-1, -1, -1, -1]",
+            "optional": False,
+            "description": "Input hyperspectral cube",
+        }
+    ],
+    "output_specs": [
+        {
+            "name": "cube",
+            "dtype": "float32",
+            "shape": "[-1, -1, -1, -1]",
+            "optional": False,
+            "description": "Normalized cube",
+        }
+    ],
+}
+
+
 @pytest.fixture
 def sample_node_info():
-    """Sample node info dictionary."""
-    return {
-        "class_name": "MinMaxNormalizer",
-        "full_path": "cuvis_ai.node.normalization.MinMaxNormalizer",
-        "source": "builtin",
-        "plugin_name": "",
-        "input_specs": [
-            {
-                "name": "cube",
-                "dtype": "float32",
-                "shape": "[-1, -1, -1, -1]",
-                "optional": False,
-                "description": "Input hyperspectral cube",
-            }
-        ],
-        "output_specs": [
-            {
-                "name": "cube",
-                "dtype": "float32",
-                "shape": "[-1, -1, -1, -1]",
-                "optional": False,
-                "description": "Normalized cube",
-            }
-        ],
-    }
+    """Sample node info dictionary (fresh copy per test)."""
+    return copy.deepcopy(SAMPLE_NODE_INFO)
 
 
-@pytest.fixture
-def node_registry(sample_node_info):
-    """NodeRegistry with sample nodes registered."""
+@pytest.fixture(scope="module")
+def node_registry():
+    """NodeRegistry with sample nodes registered (shared per module, do not mutate)."""
     registry = NodeRegistry()
-    registry.register_nodes([sample_node_info])
+    registry.register_nodes([copy.deepcopy(SAMPLE_NODE_INFO)])
     return registry
 
 
@@ -8,6 +8,7 @@ from cuvis_ai_ui.adapters.node_adapter import (
     NodeRegistry,
     CATEGORY_COLORS,
     DEFAULT_NODE_COLOR,
+    _category_for_path,
 )
 
 
@@ -393,6 +394,19 @@ def test_node_registry_get_nodes_by_category():
     assert len(categories["Data"]) == 1
 
 
+def test_category_for_path():
+    """Test category inference from a class path, including the cache."""
+    _category_for_path.cache_clear()
+
+    assert _category_for_path("cuvis_ai.node.normalization.MinMaxNormalizer") == "Normalization"
+    assert _category_for_path("my_plugin.nodes.Unrelated") == "Other"
+    # Class names count too, not only the module path
+    assert _category_for_path("my_plugin.RXAnomalyScorer") == "Anomaly"
+
+    _category_for_path("cuvis_ai.node.normalization.MinMaxNormalizer")
+    assert _category_for_path.cache_info().hits == 1
+
+
 def test_node_registry_register_with_graph():
     """Test registering node classes with a graph."""
     registry = NodeRegistry()
@@ -1,40 +1,86 @@
 """Unit tests for NodePalette widget."""
 
-from unittest.mock import MagicMock
+from types import MappingProxyType
 
+from cuvis_ai_ui.adapters import NodeRegistry, PortSpec
 from cuvis_ai_ui.widgets.node_palette import NodePalette, NodePaletteItem
 
+_EMPTY_NODE_INFO = MappingProxyType(
+    {
+        "class_name": "EmptyNode",
+        "full_path": "test.EmptyNode",
+        "source": "builtin",
+        "input_specs": [],
+        "output_specs": [],
+    }
+)
+
+# Dict-based specs (the format used in practice from gRPC client)
+_PORT_SPEC_NODE_INFO = MappingProxyType(
+    {
+        "class_name": "TestNode",
+        "full_path": "test.TestNode",
+        "source": "builtin",
+        "input_specs": [{"name": "in1", "dtype": "float32", "shape": "[-1]", "optional": False}],
+        "output_specs": [{"name": "out1", "dtype": "int64", "shape": "[-1]", "optional": True}],
+    }
+)
+
+_PLUGIN_NODE_INFO = MappingProxyType(
+    {
+        "class_name": "PluginNode",
+        "full_path": "my_plugin.PluginNode",
+        "source": "plugin",
+        "plugin_name": "my_plugin",
+        "input_specs": [],
+        "output_specs": [],
+    }
+)
+
+# Nodes whose full_path matches different CATEGORY_COLORS
+_CATEGORIZED_NODE_INFOS = tuple(
+    MappingProxyType(
+        {
+            "class_name": class_name,
+            "full_path": f"cuvis_ai.node.{module}.{class_name}",
+            "source": "builtin",
+            "plugin_name": "",
+            "input_specs": [],
+            "output_specs": [],
+        }
+    )
+    for module, class_name in (
+        ("normalization", "MinMaxNormalizer"),
+        ("model", "SimpleModel"),
+        ("data", "DataLoader"),
+    )
+)
+
+
+class _StubGraph:
+    """Stand-in for NodeGraph; these tests never call into the graph."""
 
-def _count_visible_items(palette):
-    """Count visible (non-hidden) node items in the tree."""
-    count = 0
-    for i in range(palette._tree.topLevelItemCount()):
-        cat_item = palette._tree.topLevelItem(i)
-        if cat_item is None or cat_item.isHidden():
-            continue
-        for j in range(cat_item.childCount()):
-            child = cat_item.child(j)
-            if child and not child.isHidden():
-                count += 1
-    return count
+    __slots__ = ()
+
+
+def _flush_search(palette):
+    """Apply a pending debounced search immediately."""
+    palette._filter_timer.stop()
+    palette._apply_filter()
 
 
 def test_node_palette_item_initialization(sample_node_info):
     """Test NodePaletteItem initialization with node info."""
-    mock_parent = MagicMock()
-
-    item = NodePaletteItem(mock_parent, sample_node_info)
+    item = NodePaletteItem(sample_node_info)
 
     assert item.node_info == sample_node_info
-    assert item.text(0) == "MinMaxNormalizer"
+    assert item.text() == "MinMaxNormalizer"
 
 
 def test_node_palette_item_tooltip(sample_node_info):
     """Test that NodePaletteItem generates a tooltip."""
-    mock_parent = MagicMock()
-
-    item = NodePaletteItem(mock_parent, sample_node_info)
-    tooltip = item.toolTip(0)
+    item = NodePaletteItem(sample_node_info)
+    tooltip = item.toolTip()
 
     # Tooltip should contain key information
     assert "MinMaxNormalizer" in tooltip
@@ -42,28 +88,39 @@ def test_node_palette_item_tooltip(sample_node_info):
     assert "float32" in tooltip  # dtype
 
 
+def test_node_palette_item_search_key(sample_node_info):
+    """Test that the search key holds lowercased name, path and port names."""
+    item = NodePaletteItem(sample_node_info)
+
+    assert "minmaxnormalizer" in item._search_key
+    assert "cuvis_ai.node.normalization" in item._search_key
+    assert "cube" in item._search_key
+    assert item._search_key == item._search_key.lower()
+
+
+def test_node_palette_item_uses_slots(sample_node_info):
+    """Test that item attributes live in slots, not the instance dict."""
+    item = NodePaletteItem(sample_node_info)
+
+    assert item.node_info is sample_node_info
+    assert item._search_key
+    assert "node_info" not in vars(item)
+    assert "_search_key" not in vars(item)
+
+
 def test_node_palette_item_with_empty_specs():
     """Test NodePaletteItem with node that has no port specs."""
-    node_info = {
-        "class_name": "EmptyNode",
-        "full_path": "test.EmptyNode",
-        "source": "builtin",
-        "input_specs": [],
-        "output_specs": [],
-    }
+    item = NodePaletteItem(_EMPTY_NODE_INFO)
 
-    mock_parent = MagicMock()
-    item = NodePaletteItem(mock_parent, node_info)
-
-    assert item.text(0) == "EmptyNode"
+    assert item.text() == "EmptyNode"
     # Should not crash with empty specs
-    tooltip = item.toolTip(0)
+    tooltip = item.toolTip()
     assert "EmptyNode" in tooltip
 
 
 def test_node_palette_initialization(qapp, node_registry):
     """Test NodePalette widget initialization."""
-    mock_graph = MagicMock()
+    mock_graph = _StubGraph()
 
     palette = NodePalette(node_registry, mock_graph)
 
@@ -73,157 +130,198 @@ def test_node_palette_initialization(qapp, node_registry):
 
 def test_node_palette_populate_with_registry(qapp, node_registry):
     """Test palette is populated from NodeRegistry during init."""
-    mock_graph = MagicMock()
+    mock_graph = _StubGraph()
 
     palette = NodePalette(node_registry, mock_graph)
 
     # Should have created tree items (auto-populated in __init__)
-    assert palette._tree.topLevelItemCount() > 0
+    assert palette._model.rowCount() > 0
+    assert palette.visible_count() == len(node_registry)
 
 
 def test_node_palette_search_functionality(qapp, node_registry):
     """Test search/filter functionality in palette."""
-    mock_graph = MagicMock()
+    mock_graph = _StubGraph()
 
     palette = NodePalette(node_registry, mock_graph)
 
-    initial_visible = _count_visible_items(palette)
+    initial_visible = palette.visible_count()
 
     # Search for a specific node
     palette._search_input.setText("MinMax")
+    _flush_search(palette)
 
-    filtered_visible = _count_visible_items(palette)
+    filtered_visible = palette.visible_count()
 
     # Filtered results should be <= initial results
     assert filtered_visible <= initial_visible
+    assert filtered_visible == 1
+
+    # Matching is case-insensitive and includes port names
+    palette._search_input.setText("CUBE")
+    _flush_search(palette)
+    assert palette.visible_count() == 1
+
+    # Categories without matching nodes are hidden
+    palette._search_input.setText("NonExistent")
+    _flush_search(palette)
+    assert palette.visible_count() == 0
+    assert palette._proxy.rowCount() == 0
 
 
 def test_node_palette_clear_search(qapp, node_registry):
     """Test clearing search filter."""
-    mock_graph = MagicMock()
+    mock_graph = _StubGraph()
 
     palette = NodePalette(node_registry, mock_graph)
 
-    initial_visible = _count_visible_items(palette)
+    initial_visible = palette.visible_count()
 
     # Apply filter
     palette._search_input.setText("NonExistent")
+    _flush_search(palette)
+    assert palette.visible_count() == 0
 
     # Clear filter
     palette._search_input.clear()
+    _flush_search(palette)
 
-    final_visible = _count_visible_items(palette)
+    final_visible = palette.visible_count()
 
     # Should show all items again
     assert final_visible == initial_visible
 
 
+def test_node_palette_search_matches_substrings(qapp, node_registry):
+    """Test that the search needle must appear as one contiguous substring."""
+    palette = NodePalette(node_registry, _StubGraph())
+
+    palette._search_input.setText("normalizer minmax")
+    _flush_search(palette)
+    assert palette.visible_count() == 0
+
+    palette._search_input.setText("minmaxnorm")
+    _flush_search(palette)
+    assert palette.visible_count() == 1
+
+    palette._search_input.setText("mi")
+    _flush_search(palette)
+    assert palette.visible_count() == 1
+
+
+def test_node_palette_skips_unchanged_search(qapp, node_registry, monkeypatch):
+    """Test that re-applying an unchanged search does no filtering work."""
+    palette = NodePalette(node_registry, _StubGraph())
+    palette._search_input.setText("MinMax")
+    _flush_search(palette)
+
+    calls = []
+    monkeypatch.setattr(palette._proxy, "set_search", lambda *args: calls.append(args))
+
+    # Same needle after trimming and lowercasing
+    palette._search_input.setText("  minmax ")
+    _flush_search(palette)
+    assert calls == []
+
+    palette._search_input.setText("MinMaxN")
+    _flush_search(palette)
+    assert len(calls) == 1
+
+
+def test_node_palette_search_is_debounced(qapp, qtbot, node_registry):
+    """Test that keystrokes are coalesced into one delayed filter pass."""
+    palette = NodePalette(node_registry, _StubGraph())
+
+    for prefix in ("N", "No", "Non"):
+        palette._search_input.setText(prefix)
+
+    # Nothing is filtered until the debounce timer fires
+    assert palette._filter_timer.isActive()
+    assert palette.visible_count() == len(node_registry)
+
+    qtbot.waitUntil(lambda: not palette._filter_timer.isActive())
+    assert palette.visible_count() == 0
+
+
 def test_node_palette_organizes_by_category(qapp):
     """Test that palette organizes nodes by category/plugin."""
-    mock_graph = MagicMock()
-    from cuvis_ai_ui.adapters import NodeRegistry
+    mock_graph = _StubGraph()
 
-    # Create registry with nodes whose full_path matches different CATEGORY_COLORS
     registry = NodeRegistry()
-    registry.register_nodes(
-        [
-            {
-                "class_name": "MinMaxNormalizer",
-                "full_path": "cuvis_ai.node.normalization.MinMaxNormalizer",
-                "source": "builtin",
-                "plugin_name": "",
-                "input_specs": [],
-                "output_specs": [],
-            },
-            {
-                "class_name": "SimpleModel",
-                "full_path": "cuvis_ai.node.model.SimpleModel",
-                "source": "builtin",
-                "plugin_name": "",
-                "input_specs": [],
-                "output_specs": [],
-            },
-            {
-                "class_name": "DataLoader",
-                "full_path": "cuvis_ai.node.data.DataLoader",
-                "source": "builtin",
-                "plugin_name": "",
-                "input_specs": [],
-                "output_specs": [],
-            },
-        ]
-    )
+    registry.register_nodes(list(_CATEGORIZED_NODE_INFOS))
 
     palette = NodePalette(registry, mock_graph)
 
     # Should have multiple top-level categories
-    assert palette._tree.topLevelItemCount() > 1
+    assert palette._model.rowCount() > 1
 
 
 def test_node_palette_refresh(qapp, node_registry):
     """Test refreshing palette with new nodes."""
-    mock_graph = MagicMock()
+    mock_graph = _StubGraph()
 
     palette = NodePalette(node_registry, mock_graph)
 
-    initial_count = palette._tree.topLevelItemCount()
+    initial_count = palette._model.rowCount()
 
     # Refresh by repopulating the tree
     palette._populate_tree()
 
-    final_count = palette._tree.topLevelItemCount()
+    final_count = palette._model.rowCount()
 
     # Count should be consistent after refresh
     assert final_count == initial_count
 
 
+def test_node_palette_visible_count_tracks_refresh(qapp):
+    """Test that the visible count follows refreshes under an active search."""
+    palette = NodePalette(NodeRegistry(), _StubGraph())
+    assert palette.visible_count() == 0
+
+    palette._search_input.setText("model")
+    _flush_search(palette)
+    palette.refresh_nodes(list(_CATEGORIZED_NODE_INFOS))
+
+    assert palette.visible_count() == 1
+    assert palette.get_selected_node_info() is None
+
+
 def test_node_palette_empty_registry(qapp):
     """Test palette with empty NodeRegistry."""
-    mock_graph = MagicMock()
-    from cuvis_ai_ui.adapters import NodeRegistry
+    mock_graph = _StubGraph()
 
     empty_registry = NodeRegistry()
 
     palette = NodePalette(empty_registry, mock_graph)
 
     # Should not crash with empty registry
-    assert palette._tree.topLevelItemCount() >= 0
+    assert palette._model.rowCount() >= 0
 
 
 def test_node_palette_item_selection(qapp, node_registry):
     """Test selecting an item in the palette."""
-    mock_graph = MagicMock()
+    mock_graph = _StubGraph()
 
     palette = NodePalette(node_registry, mock_graph)
 
-    # Get first item
-    if palette._tree.topLevelItemCount() > 0:
-        category_item = palette._tree.topLevelItem(0)
-        if category_item.childCount() > 0:
-            node_item = category_item.child(0)
+    # Get first node row of the first category
+    category_index = palette._proxy.index(0, 0)
+    node_index = palette._proxy.index(0, 0, category_index)
+    assert node_index.isValid()
 
-            # Select the item
-            palette._tree.setCurrentItem(node_item)
+    # Select the item
+    palette._tree.setCurrentIndex(node_index)
 
-            # Should be selected
-            assert palette._tree.currentItem() == node_item
+    # Should be selected
+    assert palette._tree.currentIndex() == node_index
+    assert palette.get_selected_node_info() == node_registry.get_all_nodes()[0]
 
 
 def test_node_palette_port_spec_in_tooltip():
     """Test that PortSpec objects are handled in tooltip via dict format."""
-    # Use dict-based specs (the format used in practice from gRPC client)
-    node_info = {
-        "class_name": "TestNode",
-        "full_path": "test.TestNode",
-        "source": "builtin",
-        "input_specs": [{"name": "in1", "dtype": "float32", "shape": "[-1]", "optional": False}],
-        "output_specs": [{"name": "out1", "dtype": "int64", "shape": "[-1]", "optional": True}],
-    }
-
-    mock_parent = MagicMock()
-    item = NodePaletteItem(mock_parent, node_info)
+    item = NodePaletteItem(_PORT_SPEC_NODE_INFO)
 
-    tooltip = item.toolTip(0)
+    tooltip = item.toolTip()
 
     # Should handle port specs in tooltip
     assert "in1" in tooltip
@@ -232,21 +330,33 @@ def test_node_palette_port_spec_in_tooltip():
     assert "int64" in tooltip
 
 
-def test_node_palette_with_plugin_source():
-    """Test NodePaletteItem with plugin source."""
+def test_node_palette_item_normalizes_mixed_specs():
+    """Test that dict and PortSpec specs are normalized to tuples once."""
     node_info = {
-        "class_name": "PluginNode",
-        "full_path": "my_plugin.PluginNode",
-        "source": "plugin",
-        "plugin_name": "my_plugin",
-        "input_specs": [],
-        "output_specs": [],
+        "class_name": "MixedNode",
+        "full_path": "test.MixedNode",
+        "input_specs": [
+            {"name": "in1", "dtype": "float32", "shape": "[-1]", "optional": True},
+            PortSpec(dtype="uint8", shape=(-1,), optional=True),
+        ],
+        "output_specs": [{"name": "out1", "dtype": "int64"}, "unsupported"],
     }
 
-    mock_parent = MagicMock()
-    item = NodePaletteItem(mock_parent, node_info)
+    item = NodePaletteItem(node_info)
+
+    assert item._inputs == (("in1", "float32", "[-1]", True), (None, "uint8", (-1,), True))
+    assert item._outputs == (("out1", "int64", (), False),)
+    tooltip = item.toolTip()
+    assert "in1: float32 (opt)" in tooltip
+    assert "  - uint8 (opt)" in tooltip
+    assert "out1: int64" in tooltip
+
+
+def test_node_palette_with_plugin_source():
+    """Test NodePaletteItem with plugin source."""
+    item = NodePaletteItem(_PLUGIN_NODE_INFO)
 
-    tooltip = item.toolTip(0)
+    tooltip = item.toolTip()
 
     # Should mention plugin name
     assert "my_plugin" in tooltip or "Plugin" in tooltip
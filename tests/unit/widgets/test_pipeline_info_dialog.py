@@ -13,6 +13,29 @@ def test_pipeline_info_dialog_initialization(qapp):
     assert dialog.windowTitle() == "Pipeline Information"
 
 
+def test_pipeline_info_dialog_builds_ui_lazily(qapp, qtbot):
+    """Test that form widgets are only built once the dialog is needed."""
+    dialog = PipelineInfoDialog(metadata={"name": "Lazy", "extra": "value"})
+    qtbot.addWidget(dialog)
+
+    assert not dialog._ui_built
+    assert dialog.findChild(QDialogButtonBox) is None
+
+    dialog.show()
+
+    assert dialog._ui_built
+    assert dialog._name_edit.text() == "Lazy"
+    assert dialog._extra_fields_group.isVisible()
+
+
+def test_pipeline_info_dialog_get_metadata_without_show(qapp):
+    """Test that get_metadata() works on a dialog that was never shown."""
+    dialog = PipelineInfoDialog(metadata={"name": "Hidden"})
+
+    assert dialog.get_metadata()["name"] == "Hidden"
+    assert dialog._ui_built
+
+
 def test_pipeline_info_dialog_with_metadata(qapp):
     """Test PipelineInfoDialog initialization with metadata."""
     metadata = {
@@ -23,6 +46,7 @@ def test_pipeline_info_dialog_with_metadata(qapp):
     }
 
     dialog = PipelineInfoDialog(metadata=metadata)
+    dialog._ensure_ui()
 
     # Should load the metadata into fields
     assert dialog._name_edit.text() == "Test Pipeline"
@@ -49,6 +73,7 @@ def test_pipeline_info_dialog_get_metadata(qapp):
 def test_pipeline_info_dialog_update_metadata(qapp):
     """Test updating metadata in dialog."""
     dialog = PipelineInfoDialog()
+    dialog._ensure_ui()
 
     # Update fields
     dialog._name_edit.setText("New Pipeline")
@@ -67,6 +92,7 @@ def test_pipeline_info_dialog_update_metadata(qapp):
 def test_pipeline_info_dialog_empty_metadata(qapp):
     """Test dialog with empty metadata."""
     dialog = PipelineInfoDialog(metadata={})
+    dialog._ensure_ui()
 
     assert dialog._name_edit.text() == ""
     assert dialog._description_edit.toPlainText() == ""
@@ -78,6 +104,7 @@ def test_pipeline_info_dialog_tags_parsing(qapp):
     metadata = {"name": "Test", "tags": ["tag1", "tag2", "tag3"]}
 
     dialog = PipelineInfoDialog(metadata=metadata)
+    dialog._ensure_ui()
 
     # Tags field should show comma-separated values
     tags_text = dialog._tags_edit.text()
@@ -89,6 +116,7 @@ def test_pipeline_info_dialog_tags_parsing(qapp):
 def test_pipeline_info_dialog_tags_output(qapp):
     """Test that tags are properly output as list."""
     dialog = PipelineInfoDialog()
+    dialog._ensure_ui()
 
     dialog._tags_edit.setText("tag1, tag2, tag3")
 
@@ -109,6 +137,7 @@ def test_pipeline_info_dialog_created_timestamp(qapp):
     metadata = {"name": "Test", "created": "2024-01-01T12:00:00"}
 
     dialog = PipelineInfoDialog(metadata=metadata)
+    dialog._ensure_ui()
 
     # Created label should show timestamp
     created_text = dialog._created_label.text()
@@ -120,6 +149,7 @@ def test_pipeline_info_dialog_created_timestamp(qapp):
 def test_pipeline_info_dialog_accept_button(qapp, qtbot):
     """Test accepting the dialog."""
     dialog = PipelineInfoDialog()
+    dialog._ensure_ui()
     dialog._name_edit.setText("Test Pipeline")
 
     # Find OK/Accept button
@@ -135,6 +165,7 @@ def test_pipeline_info_dialog_accept_button(qapp, qtbot):
 def test_pipeline_info_dialog_reject_button(qapp, qtbot):
     """Test rejecting/canceling the dialog."""
     dialog = PipelineInfoDialog()
+    dialog._ensure_ui()
 
     # Find Cancel/Reject button
     button_box = dialog.findChild(QDialogButtonBox)
@@ -157,6 +188,7 @@ def test_pipeline_info_dialog_minimum_size(qapp):
 def test_pipeline_info_dialog_field_placeholders(qapp):
     """Test that form fields have helpful placeholders."""
     dialog = PipelineInfoDialog()
+    dialog._ensure_ui()
 
     # Name field should have placeholder
     name_placeholder = dialog._name_edit.placeholderText()
@@ -173,6 +205,7 @@ def test_pipeline_info_dialog_custom_metadata_fields(qapp):
     metadata = {"name": "Test", "custom_field": "custom_value", "another_field": 123}
 
     dialog = PipelineInfoDialog(metadata=metadata)
+    dialog._ensure_ui()
 
     # Custom fields might be shown read-only or ignored
     # Dialog should not crash with extra fields
@@ -182,6 +215,7 @@ def test_pipeline_info_dialog_custom_metadata_fields(qapp):
 def test_pipeline_info_dialog_required_name_field(qapp):
     """Test that name field is marked as required."""
     dialog = PipelineInfoDialog()
+    dialog._ensure_ui()
 
     # Name field placeholder should indicate it's required
     placeholder = dialog._name_edit.placeholderText()
@@ -191,6 +225,7 @@ def test_pipeline_info_dialog_required_name_field(qapp):
 def test_pipeline_info_dialog_description_multiline(qapp):
     """Test that description field supports multiple lines."""
     dialog = PipelineInfoDialog()
+    dialog._ensure_ui()
 
     multiline_text = "Line 1\nLine 2\nLine 3"
     dialog._description_edit.setPlainText(multiline_text)
@@ -221,6 +256,7 @@ def test_pipeline_info_dialog_metadata_persistence(qapp):
 def test_pipeline_info_dialog_with_none_metadata(qapp):
     """Test dialog with None metadata (should use empty dict)."""
     dialog = PipelineInfoDialog(metadata=None)
+    dialog._ensure_ui()
 
     assert dialog is not None
     assert dialog._name_edit.text() == ""
@@ -229,6 +265,7 @@ def test_pipeline_info_dialog_with_none_metadata(qapp):
 def test_pipeline_info_dialog_whitespace_handling(qapp):
     """Test that dialog handles whitespace in fields correctly."""
     dialog = PipelineInfoDialog()
+    dialog._ensure_ui()
 
     # Set fields with extra whitespace
     dialog._name_edit.setText("  Pipeline Name  ")
@@ -238,3 +275,43 @@ def test_pipeline_info_dialog_whitespace_handling(qapp):
 
     # May or may not trim whitespace - just ensure it doesn't crash
     assert "Pipeline Name" in metadata["name"]
+
+
+def test_pipeline_info_dialog_get_metadata_cached_until_edit(qapp):
+    """Test that get_metadata() is reused until a field changes."""
+    dialog = PipelineInfoDialog(metadata={"name": "Cached", "tags": ["a"]})
+    dialog._ensure_ui()
+
+    first = dialog.get_metadata()
+    second = dialog.get_metadata()
+    assert second == first
+    assert second is not first
+
+    dialog._tags_edit.setText("a, b")
+    assert dialog.get_metadata()["tags"] == ["a", "b"]
+
+    dialog._description_edit.setPlainText("Edited")
+    assert dialog.get_metadata()["description"] == "Edited"
+
+
+def test_pipeline_info_dialog_get_metadata_result_mutation_isolated(qapp):
+    """Test that mutating a returned metadata dict does not alter later results."""
+    dialog = PipelineInfoDialog(metadata={"name": "Cached", "tags": ["a"], "extra": {"k": 1}})
+
+    first = dialog.get_metadata()
+    first["tags"].append("mutated")
+    first["extra"]["k"] = 2
+
+    second = dialog.get_metadata()
+    assert second["tags"] == ["a"]
+    assert second["extra"] == {"k": 1}
+
+
+def test_pipeline_info_dialog_tags_whitespace_and_empty_entries(qapp):
+    """Test that tags are trimmed and empty entries are dropped."""
+    dialog = PipelineInfoDialog()
+    dialog._ensure_ui()
+
+    dialog._tags_edit.setText("  tag1 ,tag2,, , tag three  ,")
+
+    assert dialog.get_metadata()["tags"] == ["tag1", "tag2", "tag three"]
@@ -1,15 +1,22 @@
 """Unit tests for PluginManager widget."""
 
+from dataclasses import dataclass, field
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
+    QDialog,
     QDialogButtonBox,
+    QMessageBox,
     QPushButton,
     QTableWidget,
     QTabWidget,
 )
 
+from cuvis_ai_ui.widgets import plugin_manager
 from cuvis_ai_ui.widgets.plugin_manager import (
     PluginManagerDialog,
     SessionDialog,
@@ -20,175 +27,270 @@ from cuvis_ai_ui.widgets.plugin_manager import (
 )
 
 
-# ---------------------------------------------------------------------------
-# PluginManagerDialog - Basic initialization
-# ---------------------------------------------------------------------------
+@dataclass
+class FakePluginClient:
+    """In-process stand-in for the plugin RPCs of CuvisAIClient.
 
+    Use mock_grpc_client instead when a test needs to assert on calls.
+    """
 
-def test_plugin_manager_dialog_initialization(qapp, mock_grpc_client):
-    """Test PluginManagerDialog initialization."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    session_id: str | None = "test-session-123"
+    available_nodes: list[dict[str, Any]] = field(default_factory=list)
+    load_response: dict[str, Any] = field(
+        default_factory=lambda: {"loaded_plugins": [], "failed_plugins": []}
+    )
+    last_manifest: str | None = None
 
-    assert dialog is not None
-    assert dialog.windowTitle() == "Plugin Manager"
-    assert dialog._client == mock_grpc_client
+    def list_available_nodes(self) -> list[dict[str, Any]]:
+        return self.available_nodes
 
+    def load_plugins(self, manifest_path: str) -> dict[str, Any]:
+        self.last_manifest = manifest_path
+        return self.load_response
 
-def test_plugin_manager_has_tabs(qapp, mock_grpc_client):
-    """Test that PluginManagerDialog has all expected tabs."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
 
-    # Find tab widget
-    tab_widget = dialog.findChild(QTabWidget)
-    assert tab_widget is not None
+_NODE_DEFAULTS = MappingProxyType(
+    {
+        "class_name": "",
+        "full_path": "",
+        "source": "builtin",
+        "plugin_name": "",
+        "input_specs": [],
+        "output_specs": [],
+    }
+)
 
-    # Should have multiple tabs
-    assert tab_widget.count() >= 3  # At minimum: Status, Git, Local, Manifest
 
+def make_node(**overrides: Any) -> dict[str, Any]:
+    """Build a list_available_nodes() entry, overriding only the fields a test cares about."""
+    node = {**_NODE_DEFAULTS, **overrides}
+    node["input_specs"] = list(node["input_specs"])
+    node["output_specs"] = list(node["output_specs"])
+    return node
+
+
+@pytest.fixture(scope="module")
+def plugin_dialog_readonly(qapp):
+    """PluginManagerDialog shared by the tests that only inspect it (do not mutate).
+
+    The child widget tree is walked once here; tests look tabs, buttons (by
+    text) and the button box up in the returned index instead.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(plugin_manager, "load_plugin_entries", list)
+        dialog = PluginManagerDialog(client=FakePluginClient())
+    tab_widget = dialog._tab_widget
+    yield SimpleNamespace(
+        dialog=dialog,
+        tab_widget=tab_widget,
+        tab_texts=[tab_widget.tabText(i) for i in range(tab_widget.count())],
+        buttons={button.text(): button for button in dialog.findChildren(QPushButton)},
+        button_box=dialog.findChild(QDialogButtonBox),
+    )
+    dialog.deleteLater()
 
-def test_plugin_manager_status_table(qapp, mock_grpc_client):
-    """Test that PluginManagerDialog has a status table."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
 
-    # Should have a status table widget
-    assert dialog._status_table is not None
-    assert isinstance(dialog._status_table, QTableWidget)
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """Temp directory shared by the filesystem-touching tests in this module."""
+    return tmp_path_factory.mktemp("plugin_manager")
 
-    # Status table should have columns
-    assert dialog._status_table.columnCount() > 0
 
+@pytest.fixture(scope="module")
+def preview_manifest_file(shared_tmp):
+    """Manifest YAML read by the preview tests, written once per module."""
+    manifest_file = shared_tmp / "plugins.yaml"
+    manifest_file.write_text("plugins:\n  test_plugin:\n    repo: x\n")
+    return manifest_file
 
-def test_plugin_manager_refresh_status(qapp, mock_grpc_client):
-    """Test refreshing plugin status."""
-    mock_grpc_client.list_available_nodes.return_value = [
-        {
-            "class_name": "TestNode",
-            "full_path": "test.TestNode",
-            "source": "builtin",
-            "plugin_name": "",
-            "input_specs": [],
-            "output_specs": [],
-        }
-    ]
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+# Returned by the patched write_manifest_temp; _load_plugins only passes it to
+# the client and ignores the failure to unlink it afterwards
+_FAKE_MANIFEST_PATH = "/fake/manifest.yaml"
 
-    # Trigger refresh
-    dialog._refresh_status()
 
-    # Should have called gRPC client
-    mock_grpc_client.list_available_nodes.assert_called()
+@pytest.fixture(autouse=True)
+def _default_plugin_io(monkeypatch):
+    """Keep every test away from the user's plugin store.
 
+    Tests that need entries or recorded saves override this, e.g. via
+    patch_plugin_io.
+    """
+    monkeypatch.setattr(plugin_manager, "load_plugin_entries", list)
+    monkeypatch.setattr(plugin_manager, "save_plugin_entries", lambda entries: None)
 
-def test_plugin_manager_plugins_loaded_signal(qapp, qtbot, mock_grpc_client):
-    """Test that plugins_loaded signal is emitted."""
-    mock_grpc_client.load_plugins.return_value = {
-        "loaded_plugins": ["test_plugin"],
-        "failed_plugins": [],
-    }
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+@pytest.fixture
+def fake_grpc_client():
+    """FakePluginClient with no available nodes and an empty load response."""
+    return FakePluginClient()
 
-    # Signal should exist
-    assert hasattr(dialog, "plugins_loaded")
 
+@pytest.fixture
+def patch_plugin_io(monkeypatch):
+    """Replace plugin persistence with in-memory stand-ins.
 
-def test_plugin_manager_close_button(qapp, mock_grpc_client):
-    """Test that dialog has a Close button."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    Assign ``entries`` before building the dialog to control what
+    load_plugin_entries returns; ``save`` records save_plugin_entries calls.
+    """
+    plugin_io = SimpleNamespace(entries=[], save=MagicMock())
+    monkeypatch.setattr(plugin_manager, "load_plugin_entries", lambda: plugin_io.entries)
+    monkeypatch.setattr(plugin_manager, "save_plugin_entries", plugin_io.save)
+    return plugin_io
 
-    # Find button box
-    button_box = dialog.findChild(QDialogButtonBox)
-    assert button_box is not None
 
-    # Should have Close button
-    close_button = button_box.button(QDialogButtonBox.StandardButton.Close)
-    assert close_button is not None
+_INPUT_FIELDS = (
+    "_git_name",
+    "_git_url",
+    "_git_provides",
+    "_local_name",
+    "_local_path",
+    "_local_provides",
+    "_manifest_path",
+    "_manifest_preview",
+)
 
 
-def test_plugin_manager_minimum_size(qapp, mock_grpc_client):
-    """Test that dialog has reasonable minimum size."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+@pytest.fixture(scope="module")
+def _shared_plugin_dialog(qapp):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(plugin_manager, "load_plugin_entries", list)
+        dialog = PluginManagerDialog(client=FakePluginClient())
+    yield dialog
+    dialog.deleteLater()
+
+
+@pytest.fixture
+def plugin_dialog(_shared_plugin_dialog, fake_grpc_client):
+    """Module-wide PluginManagerDialog reset to a freshly constructed state.
+
+    The dialog talks to this test's fake_grpc_client and its status table is
+    reloaded from the (patched) plugin store. Tests that assert on calls can
+    swap in mock_grpc_client via ``_client``; tests that seed entries after
+    setup call ``_refresh_status()`` themselves.
+    """
+    dialog = _shared_plugin_dialog
+    dialog._client = fake_grpc_client
+    dialog._is_refreshing = False
+    for attr in _INPUT_FIELDS:
+        getattr(dialog, attr).clear()
+    dialog._git_ref.setText("main")
+    dialog._refresh_status()
+    dialog._status_table.clearSelection()
+    return dialog
 
-    assert dialog.minimumWidth() > 0
-    assert dialog.minimumHeight() > 0
 
+@pytest.fixture
+def dialog_stub():
+    """Spec-only PluginManagerDialog stand-in for calling its methods unbound."""
+    return MagicMock(spec=PluginManagerDialog)
 
-def test_plugin_manager_git_tab_exists(qapp, mock_grpc_client):
-    """Test that Git loading tab exists."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
 
-    tab_widget = dialog.findChild(QTabWidget)
+# ---------------------------------------------------------------------------
+# PluginManagerDialog - Basic initialization
+# ---------------------------------------------------------------------------
 
-    # Look for Git tab
-    git_tab_found = False
-    for i in range(tab_widget.count()):
-        if "Git" in tab_widget.tabText(i):
-            git_tab_found = True
-            break
 
-    assert git_tab_found
+def test_plugin_manager_dialog_initialization(qtbot, fake_grpc_client):
+    """Test PluginManagerDialog initialization."""
+    dialog = PluginManagerDialog(client=fake_grpc_client)
+    qtbot.addWidget(dialog)
 
+    assert dialog is not None
+    assert dialog.windowTitle() == "Plugin Manager"
+    assert dialog._client == fake_grpc_client
 
-def test_plugin_manager_local_tab_exists(qapp, mock_grpc_client):
-    """Test that Local loading tab exists."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
 
-    tab_widget = dialog.findChild(QTabWidget)
+def test_plugin_manager_refresh_status(plugin_dialog, mock_grpc_client):
+    """Test that refreshing counts the server's plugin nodes for the status table."""
+    mock_grpc_client.list_available_nodes.return_value = [
+        make_node(class_name="TestNode", full_path="test.TestNode"),
+        make_node(class_name="PluginNode", source="plugin", plugin_name="my_plugin"),
+    ]
+    plugin_dialog._client = mock_grpc_client
 
-    # Look for Local tab
-    local_tab_found = False
-    for i in range(tab_widget.count()):
-        if "Local" in tab_widget.tabText(i):
-            local_tab_found = True
-            break
+    # Only the gRPC side is under test; skip filling the table
+    with patch.object(PluginManagerDialog, "_populate_status_table") as populate:
+        plugin_dialog._refresh_status()
 
-    assert local_tab_found
+    mock_grpc_client.list_available_nodes.assert_called_once()
+    populate.assert_called_once_with({"my_plugin": 1})
 
 
-def test_plugin_manager_manifest_tab_exists(qapp, mock_grpc_client):
-    """Test that Manifest loading tab exists."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+def test_plugin_manager_plugins_loaded_signal(plugin_dialog_readonly):
+    """Test that plugins_loaded signal is emitted."""
+    dialog = plugin_dialog_readonly.dialog
 
-    tab_widget = dialog.findChild(QTabWidget)
+    # Signal should exist
+    assert hasattr(dialog, "plugins_loaded")
 
-    # Look for Manifest tab
-    manifest_tab_found = False
-    for i in range(tab_widget.count()):
-        if "Manifest" in tab_widget.tabText(i):
-            manifest_tab_found = True
-            break
 
-    assert manifest_tab_found
+def test_plugin_manager_close_button(plugin_dialog_readonly):
+    """Test that dialog has a Close button."""
+    button_box = plugin_dialog_readonly.button_box
+    assert button_box is not None
 
+    # Should have Close button
+    close_button = button_box.button(QDialogButtonBox.StandardButton.Close)
+    assert close_button is not None
 
-def test_plugin_manager_status_tab_is_first(qapp, mock_grpc_client):
-    """Test that Status/Loaded Plugins tab is the first tab."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
 
-    tab_widget = dialog.findChild(QTabWidget)
+def test_plugin_manager_minimum_size(plugin_dialog_readonly):
+    """Test that dialog has reasonable minimum size."""
+    dialog = plugin_dialog_readonly.dialog
+
+    assert dialog.minimumWidth() > 0
+    assert dialog.minimumHeight() > 0
+
+
+@pytest.mark.parametrize("needle", ["Git", "Local", "Manifest"])
+def test_plugin_manager_tab_exists(needle, plugin_dialog_readonly):
+    """Test that each plugin loading tab exists."""
+    assert any(needle in text for text in plugin_dialog_readonly.tab_texts)
+
+
+@pytest.mark.parametrize(
+    ("attr", "needle"),
+    [
+        ("_refresh_btn", "Refresh"),
+        ("_remove_btn", "Remove"),
+    ],
+)
+def test_plugin_manager_status_action_button(attr, needle, plugin_dialog_readonly):
+    """Test that the status tab's Refresh and Remove buttons exist."""
+    button = getattr(plugin_dialog_readonly.dialog, attr)
+    assert isinstance(button, QPushButton)
+    assert needle in button.text()
+
+
+def test_plugin_manager_status_tab_is_first(plugin_dialog_readonly):
+    """Test that Status/Loaded Plugins tab is the first tab."""
+    assert isinstance(plugin_dialog_readonly.tab_widget, QTabWidget)
+    assert plugin_dialog_readonly.tab_widget.count() >= 4  # Status, Git, Local, Manifest
 
     # First tab should be status/loaded plugins
-    first_tab_text = tab_widget.tabText(0)
+    first_tab_text = plugin_dialog_readonly.tab_texts[0]
     assert "Loaded" in first_tab_text or "Status" in first_tab_text
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_plugin_manager_loads_saved_entries(mock_load, qapp, mock_grpc_client):
+def test_plugin_manager_loads_saved_entries(qtbot, fake_grpc_client, monkeypatch):
     """Test that dialog loads saved plugin entries on init."""
-    mock_load.return_value = []
+    mock_load = MagicMock(return_value=[])
+    monkeypatch.setattr(plugin_manager, "load_plugin_entries", mock_load)
 
-    _dialog = PluginManagerDialog(client=mock_grpc_client)
+    _dialog = PluginManagerDialog(client=fake_grpc_client)
+    qtbot.addWidget(_dialog)
 
     # Should have called load_plugin_entries
     mock_load.assert_called()
 
 
-def test_plugin_manager_status_table_columns(qapp, mock_grpc_client):
+def test_plugin_manager_status_table_columns(plugin_dialog_readonly):
     """Test that status table has correct columns."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    dialog = plugin_dialog_readonly.dialog
 
     table = dialog._status_table
+    assert isinstance(table, QTableWidget)
 
     # Should have columns: Load, Plugin Name, Type, Source, Provided Nodes
     assert table.columnCount() >= 5
@@ -201,93 +303,61 @@ def test_plugin_manager_status_table_columns(qapp, mock_grpc_client):
     assert any("Name" in h or "Plugin" in h for h in headers)
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.warning")
-def test_plugin_manager_with_failed_grpc(mock_warning, qapp):
-    """Test PluginManagerDialog when gRPC client fails."""
-    mock_client = MagicMock()
-    mock_client.list_available_nodes.side_effect = Exception("gRPC connection failed")
+@pytest.mark.parametrize(
+    "error",
+    [Exception("gRPC connection failed"), RuntimeError("gRPC down"), TimeoutError()],
+    ids=lambda error: type(error).__name__,
+)
+def test_plugin_manager_with_failed_grpc(error, plugin_dialog, mock_grpc_client, patch_plugin_io):
+    """Test that a failing node listing warns but still shows the saved plugins."""
+    patch_plugin_io.entries = [{"name": "saved", "enabled": True, "source": "git", "config": {}}]
+    mock_grpc_client.list_available_nodes.side_effect = error
+    plugin_dialog._client = mock_grpc_client
 
-    # Should not crash on initialization even if gRPC fails
-    dialog = PluginManagerDialog(client=mock_client)
+    with patch.object(plugin_manager.QMessageBox, "warning") as mock_warning:
+        plugin_dialog._refresh_status()
 
-    assert dialog is not None
-    # The error dialog should have been shown (but mocked)
     mock_warning.assert_called_once()
+    assert plugin_dialog._status_table.rowCount() == 1
+    assert plugin_dialog._is_refreshing is False
 
 
-def test_plugin_manager_refresh_button_exists(qapp, mock_grpc_client):
-    """Test that Refresh Status button exists."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    # Look for refresh button (should be in status tab)
-    # This tests that the button exists somewhere in the widget tree
-    buttons = dialog.findChildren(QPushButton)
-    refresh_button_found = any("Refresh" in btn.text() for btn in buttons)
-
-    assert refresh_button_found
+def test_plugin_manager_initial_state(plugin_dialog_readonly):
+    """Test that dialog stores plugin entries and a flag to prevent recursive updates."""
+    dialog = plugin_dialog_readonly.dialog
 
-
-def test_plugin_manager_remove_button_exists(qapp, mock_grpc_client):
-    """Test that Remove Selected button exists."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    buttons = dialog.findChildren(QPushButton)
-    remove_button_found = any("Remove" in btn.text() for btn in buttons)
-
-    assert remove_button_found
-
-
-def test_plugin_manager_plugin_entries_storage(qapp, mock_grpc_client):
-    """Test that dialog stores plugin entries."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    # Should have _plugin_entries attribute
-    assert hasattr(dialog, "_plugin_entries")
     assert isinstance(dialog._plugin_entries, list)
-
-
-def test_plugin_manager_is_refreshing_flag(qapp, mock_grpc_client):
-    """Test that dialog has _is_refreshing flag to prevent recursive updates."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    # Should have _is_refreshing flag
-    assert hasattr(dialog, "_is_refreshing")
-    assert isinstance(dialog._is_refreshing, bool)
+    assert dialog._is_refreshing is False
 
 
 @patch("cuvis_ai_ui.widgets.plugin_manager.QFileDialog.getOpenFileName")
-def test_plugin_manager_manifest_file_dialog(mock_file_dialog, qapp, mock_grpc_client):
+def test_plugin_manager_manifest_file_dialog(mock_file_dialog, plugin_dialog_readonly):
     """Test that manifest tab can trigger file dialog."""
     mock_file_dialog.return_value = ("", "")  # User cancels
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    # Find browse button in manifest tab
-    buttons = dialog.findChildren(QPushButton)
-
     # Look for a browse/select button
-    _browse_found = any("Browse" in btn.text() or "Select" in btn.text() for btn in buttons)
+    _browse_found = any(
+        "Browse" in text or "Select" in text for text in plugin_dialog_readonly.buttons
+    )
 
     # May or may not have browse button, depends on implementation
-    assert dialog is not None  # Just ensure dialog doesn't crash
+    assert plugin_dialog_readonly.dialog is not None  # Just ensure dialog doesn't crash
 
 
-def test_plugin_manager_accepts_none_parent(qapp, mock_grpc_client):
+def test_plugin_manager_accepts_none_parent(qtbot, fake_grpc_client):
     """Test that dialog accepts None as parent."""
-    dialog = PluginManagerDialog(client=mock_grpc_client, parent=None)
+    dialog = PluginManagerDialog(client=fake_grpc_client, parent=None)
+    qtbot.addWidget(dialog)
 
-    assert dialog is not None
     assert dialog.parent() is None
 
 
-def test_plugin_manager_dialog_is_modal(qapp, mock_grpc_client):
+def test_plugin_manager_dialog_is_modal(plugin_dialog_readonly):
     """Test that dialog can be shown modally."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    dialog = plugin_dialog_readonly.dialog
 
     # Should be a dialog that can be shown
     # Don't actually show it in tests, just verify it's a QDialog
-    from PySide6.QtWidgets import QDialog
-
     assert isinstance(dialog, QDialog)
 
 
@@ -296,84 +366,24 @@ def test_plugin_manager_dialog_is_modal(qapp, mock_grpc_client):
 # ---------------------------------------------------------------------------
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_refresh_status_populates_table_rows(mock_load, qapp, mock_grpc_client):
-    """Test that _refresh_status creates one table row per plugin entry."""
-    entries = [
+# One entry per source/provides scenario checked in the status table, read-only
+# so a test cannot accidentally change what the shared status dialog was built from
+_STATUS_ENTRIES = tuple(
+    MappingProxyType({**entry, "config": MappingProxyType(entry["config"])})
+    for entry in (
         {
             "name": "plugin_a",
             "enabled": True,
             "source": "git",
             "config": {"repo": "git@host:org/a.git"},
         },
-        {
-            "name": "plugin_b",
-            "enabled": False,
-            "source": "local",
-            "config": {"path": "/tmp/b"},
-        },
-    ]
-    mock_load.return_value = entries
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    assert dialog._status_table.rowCount() == 2
-
-    # First row should be plugin_a, checked
-    name_0 = dialog._status_table.item(0, STATUS_COL_NAME).text()
-    assert name_0 == "plugin_a"
-    load_0 = dialog._status_table.item(0, STATUS_COL_LOAD)
-    assert load_0.checkState() == Qt.CheckState.Checked
-
-    # Second row should be plugin_b, unchecked
-    name_1 = dialog._status_table.item(1, STATUS_COL_NAME).text()
-    assert name_1 == "plugin_b"
-    load_1 = dialog._status_table.item(1, STATUS_COL_LOAD)
-    assert load_1.checkState() == Qt.CheckState.Unchecked
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_refresh_status_shows_source_from_config_repo(mock_load, qapp, mock_grpc_client):
-    """Test that source column shows repo URL when origin is missing."""
-    entries = [
-        {
-            "name": "my_plugin",
-            "enabled": True,
-            "source": "git",
-            "config": {"repo": "git@host:org/repo.git"},
-        },
-    ]
-    mock_load.return_value = entries
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    source_text = dialog._status_table.item(0, STATUS_COL_SOURCE).text()
-    assert "git@host:org/repo.git" in source_text
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_refresh_status_shows_source_from_config_path(mock_load, qapp, mock_grpc_client):
-    """Test that source column shows path when origin is missing and config has path."""
-    entries = [
+        {"name": "plugin_b", "enabled": False, "source": "local", "config": {"path": "/tmp/b"}},
         {
             "name": "local_plugin",
             "enabled": True,
             "source": "local",
             "config": {"path": "/home/user/plugins/myplugin"},
         },
-    ]
-    mock_load.return_value = entries
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    source_text = dialog._status_table.item(0, STATUS_COL_SOURCE).text()
-    assert "/home/user/plugins/myplugin" in source_text
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_refresh_status_shows_origin_when_set(mock_load, qapp, mock_grpc_client):
-    """Test that source column shows origin field when present."""
-    entries = [
         {
             "name": "manifest_plugin",
             "enabled": True,
@@ -381,74 +391,65 @@ def test_refresh_status_shows_origin_when_set(mock_load, qapp, mock_grpc_client)
             "origin": "/some/manifest.yaml",
             "config": {"repo": "should-not-show"},
         },
-    ]
-    mock_load.return_value = entries
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    source_text = dialog._status_table.item(0, STATUS_COL_SOURCE).text()
-    assert source_text == "/some/manifest.yaml"
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_refresh_status_provides_column_shows_count(mock_load, qapp, mock_grpc_client):
-    """Test that provided nodes column shows count when provides list is present."""
-    entries = [
         {
-            "name": "my_plugin",
+            "name": "count_plugin",
             "enabled": True,
             "source": "git",
             "config": {"provides": ["node.A", "node.B", "node.C"]},
         },
-    ]
-    mock_load.return_value = entries
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    provided = dialog._status_table.item(0, STATUS_COL_PROVIDES).text()
-    assert provided == "3"
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_refresh_status_provides_column_shows_auto(mock_load, qapp, mock_grpc_client):
-    """Test that provided nodes column shows 'auto' when no provides list."""
-    entries = [
-        {
-            "name": "auto_plugin",
-            "enabled": True,
-            "source": "git",
-            "config": {"repo": "x"},
-        },
-    ]
-    mock_load.return_value = entries
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    provided = dialog._status_table.item(0, STATUS_COL_PROVIDES).text()
-    assert provided == "auto"
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_refresh_status_provides_column_from_loaded_nodes(mock_load, qapp, mock_grpc_client):
-    """Test provided column shows count from server when plugin is loaded."""
-    entries = [
-        {
-            "name": "server_plugin",
-            "enabled": True,
-            "source": "git",
-            "config": {},
-        },
-    ]
-    mock_load.return_value = entries
-    mock_grpc_client.list_available_nodes.return_value = [
-        {"source": "plugin", "plugin_name": "server_plugin"},
-        {"source": "plugin", "plugin_name": "server_plugin"},
-    ]
+        {"name": "server_plugin", "enabled": True, "source": "git", "config": {}},
+    )
+)
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
 
-    provided = dialog._status_table.item(0, STATUS_COL_PROVIDES).text()
-    assert provided == "2"
+@pytest.fixture(scope="module")
+def status_dialog(qapp):
+    """PluginManagerDialog whose status table holds _STATUS_ENTRIES (do not mutate)."""
+    client = FakePluginClient(
+        available_nodes=[
+            make_node(source="plugin", plugin_name="server_plugin"),
+            make_node(source="plugin", plugin_name="server_plugin"),
+        ]
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            plugin_manager,
+            "load_plugin_entries",
+            # _refresh_status expects plain dicts, so thaw a copy per load
+            lambda: [{**entry, "config": dict(entry["config"])} for entry in _STATUS_ENTRIES],
+        )
+        dialog = PluginManagerDialog(client=client)
+    yield dialog
+    dialog.deleteLater()
+
+
+def test_refresh_status_populates_table_rows(status_dialog):
+    """Test that _refresh_status creates one checkable table row per plugin entry."""
+    table = status_dialog._status_table
+
+    assert table.rowCount() == len(_STATUS_ENTRIES)
+    assert table.item(0, STATUS_COL_LOAD).checkState() == Qt.CheckState.Checked
+    assert table.item(1, STATUS_COL_LOAD).checkState() == Qt.CheckState.Unchecked
+
+
+@pytest.mark.parametrize(
+    ("row", "col", "expected"),
+    [
+        (0, STATUS_COL_NAME, "plugin_a"),
+        (1, STATUS_COL_NAME, "plugin_b"),
+        # Source falls back to the repo URL, then the path, when origin is missing
+        (0, STATUS_COL_SOURCE, "git@host:org/a.git"),
+        (2, STATUS_COL_SOURCE, "/home/user/plugins/myplugin"),
+        (3, STATUS_COL_SOURCE, "/some/manifest.yaml"),
+        # Provided nodes: explicit provides list, server-side count, else "auto"
+        (4, STATUS_COL_PROVIDES, "3"),
+        (5, STATUS_COL_PROVIDES, "2"),
+        (0, STATUS_COL_PROVIDES, "auto"),
+    ],
+)
+def test_refresh_status_cell_text(status_dialog, row, col, expected):
+    """Test the text of each status table cell derived from the plugin entries."""
+    assert status_dialog._status_table.item(row, col).text() == expected
 
 
 # ---------------------------------------------------------------------------
@@ -456,38 +457,33 @@ def test_refresh_status_provides_column_from_loaded_nodes(mock_load, qapp, mock_
 # ---------------------------------------------------------------------------
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.save_plugin_entries")
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_toggle_enable_checkbox_saves(mock_load, mock_save, qapp, mock_grpc_client):
-    """Test that toggling the load checkbox persists the change."""
-    entries = [
+@pytest.fixture
+def toggle_dialog(plugin_dialog, patch_plugin_io):
+    """Shared dialog reloaded with one enabled plugin; returns (dialog, save mock)."""
+    patch_plugin_io.entries = [
         {"name": "togglable", "enabled": True, "source": "git", "config": {}},
     ]
-    mock_load.return_value = entries
+    plugin_dialog._refresh_status()
+    return plugin_dialog, patch_plugin_io.save
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+
+def test_toggle_enable_checkbox_saves(toggle_dialog):
+    """Test that toggling the load checkbox persists the change."""
+    dialog, save = toggle_dialog
 
     # Uncheck the load checkbox (row 0)
     load_item = dialog._status_table.item(0, STATUS_COL_LOAD)
     load_item.setCheckState(Qt.CheckState.Unchecked)
 
     # _on_status_item_changed should have persisted
-    mock_save.assert_called()
-    saved = mock_save.call_args[0][0]
+    save.assert_called()
+    saved = save.call_args[0][0]
     assert any(e["name"] == "togglable" and e["enabled"] is False for e in saved)
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.save_plugin_entries")
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_toggle_ignored_during_refresh(mock_load, mock_save, qapp, mock_grpc_client):
+def test_toggle_ignored_during_refresh(toggle_dialog):
     """Test that item changes during refresh are ignored."""
-    entries = [
-        {"name": "no_save", "enabled": True, "source": "git", "config": {}},
-    ]
-    mock_load.return_value = entries
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    mock_save.reset_mock()
+    dialog, save = toggle_dialog
 
     # Simulate a change while _is_refreshing is True
     dialog._is_refreshing = True
@@ -495,112 +491,108 @@ def test_toggle_ignored_during_refresh(mock_load, mock_save, qapp, mock_grpc_cli
     # Manually fire the handler
     dialog._on_status_item_changed(load_item)
 
-    mock_save.assert_not_called()
+    save.assert_not_called()
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.save_plugin_entries")
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_toggle_ignored_for_non_load_column(mock_load, mock_save, qapp, mock_grpc_client):
+def test_toggle_ignored_for_non_load_column(toggle_dialog):
     """Test that item changes on non-load columns are ignored."""
-    entries = [
-        {"name": "noop", "enabled": True, "source": "git", "config": {}},
-    ]
-    mock_load.return_value = entries
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    mock_save.reset_mock()
+    dialog, save = toggle_dialog
 
     # Trigger handler for a non-load column item
     name_item = dialog._status_table.item(0, STATUS_COL_NAME)
     dialog._on_status_item_changed(name_item)
 
-    mock_save.assert_not_called()
+    save.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
-# Git tab - load plugin
+# Loader input validation
 # ---------------------------------------------------------------------------
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.warning")
-def test_load_git_plugin_no_name_shows_warning(mock_warn, qapp, mock_grpc_client):
-    """Test loading git plugin without name shows warning."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    dialog._git_name.setText("")
-    dialog._git_url.setText("git@host:org/repo.git")
+@pytest.mark.parametrize(
+    ("loader", "inputs", "expected_word"),
+    [
+        ("_load_git_plugin", {"_git_url": "git@host:org/repo.git"}, "name"),
+        ("_load_git_plugin", {"_git_name": "my_plugin"}, "url"),
+        ("_load_local_plugin", {"_local_path": "/some/path"}, "name"),
+        ("_load_local_plugin", {"_local_name": "my_plugin"}, "path"),
+        (
+            "_load_local_plugin",
+            {"_local_name": "my_plugin", "_local_path": "/nonexistent/path/does/not/exist"},
+            "not exist",
+        ),
+        ("_load_manifest_plugins", {}, "select"),
+        ("_load_manifest_plugins", {"_manifest_path": "/does/not/exist.yaml"}, "not exist"),
+    ],
+)
+def test_loader_invalid_input_shows_warning(
+    loader, inputs, expected_word, plugin_dialog, monkeypatch
+):
+    """Test that each loader warns about missing or invalid input and stops."""
+    mock_warn = MagicMock()
+    monkeypatch.setattr(plugin_manager.QMessageBox, "warning", mock_warn)
+    for attr, text in inputs.items():
+        getattr(plugin_dialog, attr).setText(text)
 
-    dialog._load_git_plugin()
+    getattr(plugin_dialog, loader)()
 
     mock_warn.assert_called_once()
-    assert "name" in mock_warn.call_args[0][2].lower()
+    assert expected_word in mock_warn.call_args[0][2].lower()
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.warning")
-def test_load_git_plugin_no_url_shows_warning(mock_warn, qapp, mock_grpc_client):
-    """Test loading git plugin without URL shows warning."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    dialog._git_name.setText("my_plugin")
-    dialog._git_url.setText("")
-
-    dialog._load_git_plugin()
-
-    mock_warn.assert_called_once()
-    assert "url" in mock_warn.call_args[0][2].lower()
+# ---------------------------------------------------------------------------
+# Git tab - load plugin
+# ---------------------------------------------------------------------------
 
 
 @patch("cuvis_ai_ui.widgets.plugin_manager.write_manifest_temp")
 @patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.information")
-def test_load_git_plugin_success(mock_info, mock_temp, qapp, mock_grpc_client, tmp_path):
-    """Test successful git plugin loading."""
-    temp_file = tmp_path / "manifest.yaml"
-    temp_file.touch()
-    mock_temp.return_value = str(temp_file)
+def test_load_git_plugin_success_with_provides(
+    mock_info, mock_temp, plugin_dialog, mock_grpc_client
+):
+    """Test successful git plugin loading with explicit provides list."""
+    mock_temp.return_value = _FAKE_MANIFEST_PATH
 
     mock_grpc_client.load_plugins.return_value = {
         "loaded_plugins": ["my_plugin"],
         "failed_plugins": [],
     }
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    dialog = plugin_dialog
+    dialog._client = mock_grpc_client
 
     dialog._git_name.setText("my_plugin")
     dialog._git_url.setText("git@host:org/repo.git")
     dialog._git_ref.setText("v1.0")
+    dialog._git_provides.setPlainText("my_plugin.NodeA\nmy_plugin.NodeB")
 
     dialog._load_git_plugin()
 
     mock_grpc_client.load_plugins.assert_called_once()
     mock_info.assert_called_once()
 
+    # Verify the manifest passed to write_manifest_temp includes provides
+    manifest_arg = mock_temp.call_args[0][0]
+    assert manifest_arg["plugins"]["my_plugin"]["ref"] == "v1.0"
+    provides = manifest_arg["plugins"]["my_plugin"].get("provides", [])
+    assert "my_plugin.NodeA" in provides
+    assert "my_plugin.NodeB" in provides
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.write_manifest_temp")
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.information")
-def test_load_git_plugin_with_provides(mock_info, mock_temp, qapp, mock_grpc_client, tmp_path):
-    """Test git plugin loading with explicit provides list."""
-    temp_file = tmp_path / "manifest.yaml"
-    temp_file.touch()
-    mock_temp.return_value = str(temp_file)
-
-    mock_grpc_client.load_plugins.return_value = {
-        "loaded_plugins": ["my_plugin"],
-        "failed_plugins": [],
-    }
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+def test_load_git_plugin_without_provides(plugin_dialog, monkeypatch):
+    """Test that an empty provides field leaves provides out of the manifest."""
+    load_plugins = MagicMock()
+    monkeypatch.setattr(PluginManagerDialog, "_load_plugins", load_plugins)
+    dialog = plugin_dialog
 
     dialog._git_name.setText("my_plugin")
     dialog._git_url.setText("git@host:org/repo.git")
-    dialog._git_provides.setPlainText("my_plugin.NodeA\nmy_plugin.NodeB")
 
     dialog._load_git_plugin()
 
-    # Verify the manifest passed to write_manifest_temp includes provides
-    manifest_arg = mock_temp.call_args[0][0]
-    provides = manifest_arg["plugins"]["my_plugin"].get("provides", [])
-    assert "my_plugin.NodeA" in provides
-    assert "my_plugin.NodeB" in provides
+    manifest = load_plugins.call_args[0][0]
+    assert "provides" not in manifest["plugins"]["my_plugin"]
 
 
 # ---------------------------------------------------------------------------
@@ -608,65 +600,24 @@ def test_load_git_plugin_with_provides(mock_info, mock_temp, qapp, mock_grpc_cli
 # ---------------------------------------------------------------------------
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.warning")
-def test_load_local_plugin_no_name_shows_warning(mock_warn, qapp, mock_grpc_client):
-    """Test loading local plugin without name shows warning."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    dialog._local_name.setText("")
-    dialog._local_path.setText("/some/path")
-
-    dialog._load_local_plugin()
-
-    mock_warn.assert_called_once()
-    assert "name" in mock_warn.call_args[0][2].lower()
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.warning")
-def test_load_local_plugin_no_path_shows_warning(mock_warn, qapp, mock_grpc_client):
-    """Test loading local plugin without path shows warning."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    dialog._local_name.setText("my_plugin")
-    dialog._local_path.setText("")
-
-    dialog._load_local_plugin()
-
-    mock_warn.assert_called_once()
-    assert "path" in mock_warn.call_args[0][2].lower()
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.warning")
-def test_load_local_plugin_nonexistent_path_shows_warning(mock_warn, qapp, mock_grpc_client):
-    """Test loading local plugin with nonexistent path shows warning."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    dialog._local_name.setText("my_plugin")
-    dialog._local_path.setText("/nonexistent/path/does/not/exist")
-
-    dialog._load_local_plugin()
-
-    mock_warn.assert_called_once()
-    assert "not exist" in mock_warn.call_args[0][2].lower()
-
-
 @patch("cuvis_ai_ui.widgets.plugin_manager.write_manifest_temp")
 @patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.information")
-def test_load_local_plugin_success(mock_info, mock_temp, qapp, mock_grpc_client, tmp_path):
+def test_load_local_plugin_success(
+    mock_info, mock_temp, plugin_dialog, mock_grpc_client, shared_tmp
+):
     """Test successful local plugin loading."""
-    plugin_dir = tmp_path / "my_plugin"
-    plugin_dir.mkdir()
+    plugin_dir = shared_tmp / "my_plugin"
+    plugin_dir.mkdir(exist_ok=True)
 
-    temp_file = tmp_path / "manifest.yaml"
-    temp_file.touch()
-    mock_temp.return_value = str(temp_file)
+    mock_temp.return_value = _FAKE_MANIFEST_PATH
 
     mock_grpc_client.load_plugins.return_value = {
         "loaded_plugins": ["my_plugin"],
         "failed_plugins": [],
     }
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    dialog = plugin_dialog
+    dialog._client = mock_grpc_client
 
     dialog._local_name.setText("my_plugin")
     dialog._local_path.setText(str(plugin_dir))
@@ -677,50 +628,17 @@ def test_load_local_plugin_success(mock_info, mock_temp, qapp, mock_grpc_client,
     mock_info.assert_called_once()
 
 
-# ---------------------------------------------------------------------------
-# Manifest tab - load plugins
-# ---------------------------------------------------------------------------
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.warning")
-def test_load_manifest_no_path_shows_warning(mock_warn, qapp, mock_grpc_client):
-    """Test loading manifest without path shows warning."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    dialog._manifest_path.setText("")
-
-    dialog._load_manifest_plugins()
-
-    mock_warn.assert_called_once()
-    assert (
-        "select" in mock_warn.call_args[0][2].lower() or "file" in mock_warn.call_args[0][2].lower()
-    )
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.warning")
-def test_load_manifest_nonexistent_file_shows_warning(mock_warn, qapp, mock_grpc_client):
-    """Test loading manifest with nonexistent file shows warning."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    dialog._manifest_path.setText("/does/not/exist.yaml")
-
-    dialog._load_manifest_plugins()
-
-    mock_warn.assert_called_once()
-
-
 # ---------------------------------------------------------------------------
 # _persist_plugins_from_manifest
 # ---------------------------------------------------------------------------
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.save_plugin_entries")
 @patch("cuvis_ai_ui.widgets.plugin_manager.merge_plugin_entries")
-def test_persist_plugins_from_manifest(mock_merge, mock_save, qapp, mock_grpc_client):
+def test_persist_plugins_from_manifest(mock_merge, plugin_dialog, patch_plugin_io):
     """Test persisting loaded plugins from a manifest dict."""
     mock_merge.return_value = [{"name": "foo", "enabled": True, "source": "git", "config": {}}]
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    dialog = plugin_dialog
 
     manifest = {
         "plugins": {
@@ -732,16 +650,15 @@ def test_persist_plugins_from_manifest(mock_merge, mock_save, qapp, mock_grpc_cl
     dialog._persist_plugins_from_manifest(manifest, loaded=["foo"], source="git")
 
     mock_merge.assert_called_once()
-    mock_save.assert_called_once()
+    patch_plugin_io.save.assert_called_once()
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.save_plugin_entries")
 @patch("cuvis_ai_ui.widgets.plugin_manager.merge_plugin_entries")
-def test_persist_plugins_with_origin(mock_merge, mock_save, qapp, mock_grpc_client):
+def test_persist_plugins_with_origin(mock_merge, plugin_dialog):
     """Test persisting plugins with an origin field."""
     mock_merge.return_value = []
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    dialog = plugin_dialog
 
     manifest = {"plugins": {"foo": {"repo": "x"}}}
     dialog._persist_plugins_from_manifest(
@@ -752,28 +669,26 @@ def test_persist_plugins_with_origin(mock_merge, mock_save, qapp, mock_grpc_clie
     assert merge_arg[0]["origin"] == "/path/to/manifest.yaml"
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.save_plugin_entries")
-def test_persist_plugins_empty_loaded_list(mock_save, qapp, mock_grpc_client):
+def test_persist_plugins_empty_loaded_list(plugin_dialog, patch_plugin_io):
     """Test that persist does nothing when loaded list is empty."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    mock_save.reset_mock()
+    dialog = plugin_dialog
+    patch_plugin_io.save.reset_mock()
 
     manifest = {"plugins": {"foo": {"repo": "x"}}}
     dialog._persist_plugins_from_manifest(manifest, loaded=[], source="git")
 
-    mock_save.assert_not_called()
+    patch_plugin_io.save.assert_not_called()
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.save_plugin_entries")
-def test_persist_plugins_invalid_manifest(mock_save, qapp, mock_grpc_client):
+def test_persist_plugins_invalid_manifest(plugin_dialog, patch_plugin_io):
     """Test that persist does nothing with invalid manifest structure."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    mock_save.reset_mock()
+    dialog = plugin_dialog
+    patch_plugin_io.save.reset_mock()
 
     manifest = {"plugins": "not_a_dict"}
     dialog._persist_plugins_from_manifest(manifest, loaded=["foo"], source="git")
 
-    mock_save.assert_not_called()
+    patch_plugin_io.save.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -781,9 +696,9 @@ def test_persist_plugins_invalid_manifest(mock_save, qapp, mock_grpc_client):
 # ---------------------------------------------------------------------------
 
 
-def test_format_failed_plugins_dict(qapp, mock_grpc_client):
+def test_format_failed_plugins_dict(plugin_dialog_readonly):
     """Test formatting failed plugins from dict."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    dialog = plugin_dialog_readonly.dialog
 
     result = dialog._format_failed_plugins({"p1": "import error", "p2": "not found"})
 
@@ -791,9 +706,9 @@ def test_format_failed_plugins_dict(qapp, mock_grpc_client):
     assert "p2: not found" in result
 
 
-def test_format_failed_plugins_list(qapp, mock_grpc_client):
+def test_format_failed_plugins_list(plugin_dialog_readonly):
     """Test formatting failed plugins from list."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    dialog = plugin_dialog_readonly.dialog
 
     result = dialog._format_failed_plugins(["plugin_a", "plugin_b"])
 
@@ -801,9 +716,9 @@ def test_format_failed_plugins_list(qapp, mock_grpc_client):
     assert "plugin_b" in result
 
 
-def test_format_failed_plugins_string(qapp, mock_grpc_client):
+def test_format_failed_plugins_string(plugin_dialog_readonly):
     """Test formatting failed plugins from string."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    dialog = plugin_dialog_readonly.dialog
 
     result = dialog._format_failed_plugins("some error message")
 
@@ -815,45 +730,32 @@ def test_format_failed_plugins_string(qapp, mock_grpc_client):
 # ---------------------------------------------------------------------------
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.QFileDialog.getExistingDirectory")
-def test_browse_local_path_sets_text(mock_dir, qapp, mock_grpc_client):
-    """Test that browsing local path sets path and auto-fills name."""
-    mock_dir.return_value = "/home/user/my_cool_plugin"
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    dialog._local_name.setText("")  # Ensure name is empty
-
-    dialog._browse_local_path()
-
-    assert dialog._local_path.text() == "/home/user/my_cool_plugin"
-    assert dialog._local_name.text() == "my_cool_plugin"
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.QFileDialog.getExistingDirectory")
-def test_browse_local_path_cancelled(mock_dir, qapp, mock_grpc_client):
-    """Test that cancelling the directory dialog doesn't change anything."""
-    mock_dir.return_value = ""
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    dialog._local_path.setText("original")
-
-    dialog._browse_local_path()
-
-    assert dialog._local_path.text() == "original"
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.QFileDialog.getExistingDirectory")
-def test_browse_local_path_does_not_overwrite_name(mock_dir, qapp, mock_grpc_client):
-    """Test that browsing doesn't overwrite existing name."""
-    mock_dir.return_value = "/home/user/my_plugin"
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    dialog._local_name.setText("keep_this")
+@pytest.mark.parametrize(
+    ("selected_dir", "init_name", "init_path", "expected_name", "expected_path"),
+    [
+        # Browsing sets the path and auto-fills an empty name
+        ("/home/user/my_cool_plugin", "", "", "my_cool_plugin", "/home/user/my_cool_plugin"),
+        # Cancelling the directory dialog changes nothing
+        ("", "", "original", "", "original"),
+        # An existing name is preserved
+        ("/home/user/my_plugin", "keep_this", "", "keep_this", "/home/user/my_plugin"),
+    ],
+    ids=["sets_text", "cancelled", "keeps_name"],
+)
+def test_browse_local_path(
+    selected_dir, init_name, init_path, expected_name, expected_path, plugin_dialog, monkeypatch
+):
+    """Test that browsing for a local path fills the path and name fields."""
+    monkeypatch.setattr(
+        plugin_manager.QFileDialog, "getExistingDirectory", lambda *args, **kwargs: selected_dir
+    )
+    plugin_dialog._local_name.setText(init_name)
+    plugin_dialog._local_path.setText(init_path)
 
-    dialog._browse_local_path()
+    plugin_dialog._browse_local_path()
 
-    # Name should be preserved because it was already set
-    assert dialog._local_name.text() == "keep_this"
+    assert plugin_dialog._local_name.text() == expected_name
+    assert plugin_dialog._local_path.text() == expected_path
 
 
 # ---------------------------------------------------------------------------
@@ -861,23 +763,26 @@ def test_browse_local_path_does_not_overwrite_name(mock_dir, qapp, mock_grpc_cli
 # ---------------------------------------------------------------------------
 
 
-def test_preview_manifest(qapp, mock_grpc_client, tmp_path):
+def test_preview_manifest(plugin_dialog, preview_manifest_file):
     """Test preview manifest reads file content."""
-    manifest_file = tmp_path / "plugins.yaml"
-    manifest_file.write_text("plugins:\n  test_plugin:\n    repo: x\n")
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    dialog._preview_manifest(str(manifest_file))
+    dialog = plugin_dialog
+    dialog._preview_manifest(str(preview_manifest_file))
 
     assert "test_plugin" in dialog._manifest_preview.toPlainText()
 
 
-def test_preview_manifest_error(qapp, mock_grpc_client):
+def test_preview_manifest_error(plugin_dialog, monkeypatch):
     """Test preview manifest with unreadable file shows error."""
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    dialog._preview_manifest("/nonexistent/file.yaml")
+    # Shadow open() for plugin_manager only, so the read fails without touching disk
+    monkeypatch.setattr(
+        plugin_manager, "open", MagicMock(side_effect=FileNotFoundError("nope")), raising=False
+    )
+
+    dialog = plugin_dialog
+    dialog._preview_manifest("dummy.yaml")
 
     assert "Error" in dialog._manifest_preview.toPlainText()
+    assert "nope" in dialog._manifest_preview.toPlainText()
 
 
 # ---------------------------------------------------------------------------
@@ -885,70 +790,54 @@ def test_preview_manifest_error(qapp, mock_grpc_client):
 # ---------------------------------------------------------------------------
 
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.save_plugin_entries")
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.question")
-def test_remove_selected_plugins(mock_question, mock_load, mock_save, qapp, mock_grpc_client):
-    """Test removing selected plugins."""
-    from PySide6.QtWidgets import QMessageBox
+class TestRemoveSelectedPlugins:
+    """_remove_selected_plugins on a status table holding keep_me and remove_me."""
 
-    mock_question.return_value = QMessageBox.StandardButton.Yes
-    entries = [
-        {"name": "keep_me", "enabled": True, "source": "git", "config": {}},
-        {"name": "remove_me", "enabled": True, "source": "git", "config": {}},
-    ]
-    mock_load.return_value = entries
+    @pytest.fixture(autouse=True)
+    def remove_env(self, plugin_dialog, patch_plugin_io):
+        """Seed the status table and stub the confirmation prompt for every test."""
+        patch_plugin_io.entries = [
+            {"name": "keep_me", "enabled": True, "source": "git", "config": {}},
+            {"name": "remove_me", "enabled": True, "source": "git", "config": {}},
+        ]
+        plugin_dialog._refresh_status()
+        plugin_dialog._status_table.clearSelection()
+        with patch.object(plugin_manager.QMessageBox, "question") as question:
+            yield SimpleNamespace(
+                dialog=plugin_dialog, save=patch_plugin_io.save, question=question
+            )
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
+    def test_removes_selected_row(self, remove_env):
+        """Test removing selected plugins."""
+        remove_env.question.return_value = QMessageBox.StandardButton.Yes
 
-    # Select the second row
-    dialog._status_table.selectRow(1)
+        # Select the second row
+        remove_env.dialog._status_table.selectRow(1)
 
-    dialog._remove_selected_plugins()
+        remove_env.dialog._remove_selected_plugins()
 
-    # save_plugin_entries should have been called with only "keep_me"
-    assert mock_save.called
-    saved_entries = mock_save.call_args[0][0]
-    names = [e["name"] for e in saved_entries]
-    assert "keep_me" in names
-    assert "remove_me" not in names
+        # save_plugin_entries should have been called with only "keep_me"
+        assert remove_env.save.called
+        saved_entries = remove_env.save.call_args[0][0]
+        names = [e["name"] for e in saved_entries]
+        assert "keep_me" in names
+        assert "remove_me" not in names
 
+    def test_user_cancels(self, remove_env):
+        """Test that user cancelling the remove dialog does not remove anything."""
+        remove_env.question.return_value = QMessageBox.StandardButton.No
 
-@patch("cuvis_ai_ui.widgets.plugin_manager.save_plugin_entries")
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-@patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.question")
-def test_remove_selected_user_cancels(mock_question, mock_load, mock_save, qapp, mock_grpc_client):
-    """Test that user cancelling the remove dialog does not remove anything."""
-    from PySide6.QtWidgets import QMessageBox
+        remove_env.dialog._status_table.selectRow(0)
+        remove_env.dialog._remove_selected_plugins()
 
-    mock_question.return_value = QMessageBox.StandardButton.No
-    entries = [
-        {"name": "keep_me", "enabled": True, "source": "git", "config": {}},
-    ]
-    mock_load.return_value = entries
+        remove_env.save.assert_not_called()
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    mock_save.reset_mock()
+    def test_no_selection(self, remove_env):
+        """Test remove does nothing with no selection."""
+        remove_env.dialog._remove_selected_plugins()
 
-    dialog._status_table.selectRow(0)
-    dialog._remove_selected_plugins()
-
-    mock_save.assert_not_called()
-
-
-@patch("cuvis_ai_ui.widgets.plugin_manager.load_plugin_entries")
-def test_remove_selected_no_selection(mock_load, qapp, mock_grpc_client):
-    """Test remove does nothing with no selection."""
-    entries = [
-        {"name": "plugin_a", "enabled": True, "source": "git", "config": {}},
-    ]
-    mock_load.return_value = entries
-
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    dialog._status_table.clearSelection()
-
-    # Should not crash
-    dialog._remove_selected_plugins()
+        remove_env.question.assert_not_called()
+        remove_env.save.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -958,33 +847,28 @@ def test_remove_selected_no_selection(mock_load, qapp, mock_grpc_client):
 
 @patch("cuvis_ai_ui.widgets.plugin_manager.reset_plugin_entries")
 @patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.question")
-def test_reset_to_defaults(mock_question, mock_reset, qapp, mock_grpc_client):
+def test_reset_to_defaults(mock_question, mock_reset, dialog_stub):
     """Test reset to defaults when user confirms."""
-    from PySide6.QtWidgets import QMessageBox
-
     mock_question.return_value = QMessageBox.StandardButton.Yes
     mock_reset.return_value = []
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    dialog._reset_to_defaults()
+    PluginManagerDialog._reset_to_defaults(dialog_stub)
 
     mock_reset.assert_called_once()
+    assert dialog_stub._plugin_entries == []
+    dialog_stub._refresh_status.assert_called_once()
 
 
 @patch("cuvis_ai_ui.widgets.plugin_manager.reset_plugin_entries")
 @patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.question")
-def test_reset_to_defaults_user_cancels(mock_question, mock_reset, qapp, mock_grpc_client):
+def test_reset_to_defaults_user_cancels(mock_question, mock_reset, dialog_stub):
     """Test reset to defaults when user cancels."""
-    from PySide6.QtWidgets import QMessageBox
-
     mock_question.return_value = QMessageBox.StandardButton.No
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-
-    dialog._reset_to_defaults()
+    PluginManagerDialog._reset_to_defaults(dialog_stub)
 
     mock_reset.assert_not_called()
+    dialog_stub._refresh_status.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -994,37 +878,35 @@ def test_reset_to_defaults_user_cancels(mock_question, mock_reset, qapp, mock_gr
 
 @patch("cuvis_ai_ui.widgets.plugin_manager.write_manifest_temp")
 @patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.warning")
-def test_load_plugins_with_failures(mock_warn, mock_temp, qapp, mock_grpc_client, tmp_path):
+def test_load_plugins_with_failures(mock_warn, mock_temp, dialog_stub, fake_grpc_client):
     """Test _load_plugins displays warning for failed plugins."""
-    temp_file = tmp_path / "m.yaml"
-    temp_file.touch()
-    mock_temp.return_value = str(temp_file)
+    mock_temp.return_value = _FAKE_MANIFEST_PATH
 
-    mock_grpc_client.load_plugins.return_value = {
+    fake_grpc_client.load_response = {
         "loaded_plugins": [],
         "failed_plugins": ["bad_plugin"],
     }
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    dialog._load_plugins({"plugins": {"bad_plugin": {}}}, source="git")
+    dialog_stub._client = fake_grpc_client
+    PluginManagerDialog._load_plugins(dialog_stub, {"plugins": {"bad_plugin": {}}}, source="git")
 
     mock_warn.assert_called_once()
+    dialog_stub._format_failed_plugins.assert_called_once_with(["bad_plugin"])
 
 
 @patch("cuvis_ai_ui.widgets.plugin_manager.write_manifest_temp")
 @patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.critical")
-def test_load_plugins_grpc_error(mock_crit, mock_temp, qapp, mock_grpc_client, tmp_path):
+def test_load_plugins_grpc_error(mock_crit, mock_temp, dialog_stub, mock_grpc_client):
     """Test _load_plugins shows error dialog on gRPC failure."""
-    temp_file = tmp_path / "m.yaml"
-    temp_file.touch()
-    mock_temp.return_value = str(temp_file)
+    mock_temp.return_value = _FAKE_MANIFEST_PATH
 
     mock_grpc_client.load_plugins.side_effect = RuntimeError("gRPC down")
 
-    dialog = PluginManagerDialog(client=mock_grpc_client)
-    dialog._load_plugins({"plugins": {"p": {}}}, source="git")
+    dialog_stub._client = mock_grpc_client
+    PluginManagerDialog._load_plugins(dialog_stub, {"plugins": {"p": {}}}, source="git")
 
     mock_crit.assert_called_once()
+    dialog_stub._persist_plugins_from_manifest.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -1032,114 +914,111 @@ def test_load_plugins_grpc_error(mock_crit, mock_temp, qapp, mock_grpc_client, t
 # ---------------------------------------------------------------------------
 
 
-def test_session_dialog_initialization(qapp, mock_grpc_client):
+def test_session_dialog_initialization(qtbot, mock_grpc_client):
     """Test SessionDialog basic initialization."""
     dialog = SessionDialog(client=mock_grpc_client)
+    qtbot.addWidget(dialog)
 
     assert dialog.windowTitle() == "Session Manager"
     assert dialog._client == mock_grpc_client
 
 
-def test_session_dialog_no_client(qapp):
-    """Test SessionDialog when client is None."""
-    dialog = SessionDialog(client=None)
-
-    assert dialog._session_id_label.text() == "No client"
-    assert dialog._status_label.text() == "Disconnected"
-    assert dialog._create_btn.isEnabled() is False
-    assert dialog._close_btn.isEnabled() is False
+@pytest.fixture
+def session_client(request, mock_grpc_client):
+    """Client for SessionDialog by kind: "none", "active" or "no_session"."""
+    if request.param == "none":
+        return None
+    mock_grpc_client.session_id = "abc-123" if request.param == "active" else None
+    return mock_grpc_client
 
 
-def test_session_dialog_with_active_session(qapp, mock_grpc_client):
-    """Test SessionDialog shows session info when session is active."""
-    mock_grpc_client.session_id = "abc-123"
-
-    dialog = SessionDialog(client=mock_grpc_client)
-
-    assert dialog._session_id_label.text() == "abc-123"
-    assert dialog._status_label.text() == "Connected"
-    assert dialog._close_btn.isEnabled() is True
-    assert dialog._create_btn.isEnabled() is False
-
-
-def test_session_dialog_no_session(qapp):
-    """Test SessionDialog when connected but no session."""
-    client = MagicMock()
-    client.session_id = None
-
-    dialog = SessionDialog(client=client)
+@pytest.mark.parametrize(
+    ("session_client", "label", "status", "create_enabled", "close_enabled"),
+    [
+        ("none", "No client", "Disconnected", False, False),
+        ("active", "abc-123", "Connected", False, True),
+        ("no_session", "None", "No session", True, False),
+    ],
+    indirect=["session_client"],
+)
+def test_session_dialog_state(qtbot, session_client, label, status, create_enabled, close_enabled):
+    """Test the SessionDialog labels and buttons for each client/session state."""
+    dialog = SessionDialog(client=session_client)
+    qtbot.addWidget(dialog)
 
-    assert dialog._session_id_label.text() == "None"
-    assert dialog._status_label.text() == "No session"
-    assert dialog._create_btn.isEnabled() is True
-    assert dialog._close_btn.isEnabled() is False
+    assert dialog._session_id_label.text() == label
+    assert dialog._status_label.text() == status
+    assert dialog._create_btn.isEnabled() is create_enabled
+    assert dialog._close_btn.isEnabled() is close_enabled
 
 
 @patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.information")
-def test_session_dialog_create_session(mock_info, qapp):
+def test_session_dialog_create_session(mock_info, qtbot, mock_grpc_client):
     """Test creating a session via SessionDialog."""
-    client = MagicMock()
-    client.session_id = None
-    client.create_session.return_value = "new-session-456"
+    mock_grpc_client.session_id = None
+    mock_grpc_client.create_session.return_value = "new-session-456"
 
-    dialog = SessionDialog(client=client)
+    dialog = SessionDialog(client=mock_grpc_client)
+    qtbot.addWidget(dialog)
     dialog._create_session()
 
-    client.create_session.assert_called_once()
+    mock_grpc_client.create_session.assert_called_once()
     mock_info.assert_called_once()
 
 
 @patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.critical")
-def test_session_dialog_create_session_failure(mock_crit, qapp):
+def test_session_dialog_create_session_failure(mock_crit, qtbot, mock_grpc_client):
     """Test creating a session that fails."""
-    client = MagicMock()
-    client.session_id = None
-    client.create_session.side_effect = RuntimeError("Cannot create")
+    mock_grpc_client.session_id = None
+    mock_grpc_client.create_session.side_effect = RuntimeError("Cannot create")
 
-    dialog = SessionDialog(client=client)
+    dialog = SessionDialog(client=mock_grpc_client)
+    qtbot.addWidget(dialog)
     dialog._create_session()
 
     mock_crit.assert_called_once()
 
 
 @patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.information")
-def test_session_dialog_close_session(mock_info, qapp, mock_grpc_client):
+def test_session_dialog_close_session(mock_info, qtbot, mock_grpc_client):
     """Test closing a session via SessionDialog."""
     dialog = SessionDialog(client=mock_grpc_client)
+    qtbot.addWidget(dialog)
     dialog._close_session()
 
     mock_grpc_client.close_session.assert_called_once()
 
 
 @patch("cuvis_ai_ui.widgets.plugin_manager.QMessageBox.critical")
-def test_session_dialog_close_session_failure(mock_crit, qapp):
+def test_session_dialog_close_session_failure(mock_crit, qtbot, mock_grpc_client):
     """Test closing a session that fails."""
-    client = MagicMock()
-    client.session_id = "s123"
-    client.close_session.side_effect = RuntimeError("Cannot close")
+    mock_grpc_client.session_id = "s123"
+    mock_grpc_client.close_session.side_effect = RuntimeError("Cannot close")
 
-    dialog = SessionDialog(client=client)
+    dialog = SessionDialog(client=mock_grpc_client)
+    qtbot.addWidget(dialog)
     dialog._close_session()
 
     mock_crit.assert_called_once()
 
 
-def test_session_dialog_set_client(qapp):
+def test_session_dialog_set_client(qtbot, mock_grpc_client):
     """Test setting a new client on SessionDialog."""
     dialog = SessionDialog(client=None)
+    qtbot.addWidget(dialog)
     assert dialog._session_id_label.text() == "No client"
 
-    new_client = MagicMock()
-    new_client.session_id = "updated-session"
-    dialog.set_client(new_client)
+    mock_grpc_client.session_id = "updated-session"
+    dialog.set_client(mock_grpc_client)
 
-    assert dialog._client == new_client
+    assert dialog._client == mock_grpc_client
     assert dialog._session_id_label.text() == "updated-session"
 
 
-def test_session_dialog_set_client_to_none(qapp, mock_grpc_client):
+def test_session_dialog_set_client_to_none(qtbot, mock_grpc_client):
     """Test setting client to None on SessionDialog."""
     dialog = SessionDialog(client=mock_grpc_client)
+    qtbot.addWidget(dialog)
 
     dialog.set_client(None)
 
@@ -1147,9 +1026,10 @@ def test_session_dialog_set_client_to_none(qapp, mock_grpc_client):
     assert dialog._create_btn.isEnabled() is False
 
 
-def test_session_dialog_has_close_button(qapp, mock_grpc_client):
+def test_session_dialog_has_close_button(qtbot, mock_grpc_client):
     """Test that SessionDialog has a Close button."""
     dialog = SessionDialog(client=mock_grpc_client)
+    qtbot.addWidget(dialog)
 
     button_box = dialog.findChild(QDialogButtonBox)
     assert button_box is not None
@@ -1158,15 +1038,17 @@ def test_session_dialog_has_close_button(qapp, mock_grpc_client):
     assert close_btn is not None
 
 
-def test_session_dialog_create_session_does_nothing_when_no_client(qapp):
+def test_session_dialog_create_session_does_nothing_when_no_client(qtbot):
     """Test that _create_session does nothing when client is None."""
     dialog = SessionDialog(client=None)
+    qtbot.addWidget(dialog)
     # Should not crash
     dialog._create_session()
 
 
-def test_session_dialog_close_session_does_nothing_when_no_client(qapp):
+def test_session_dialog_close_session_does_nothing_when_no_client(qtbot):
     """Test that _close_session does nothing when client is None."""
     dialog = SessionDialog(client=None)
+    qtbot.addWidget(dialog)
     # Should not crash
     dialog._close_session()
@@ -1,59 +1,102 @@
 """Unit tests for PropertyEditor widget."""
 
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock
+from cuvis_ai_schemas.pipeline.ports import PortSpec
 from PySide6.QtWidgets import QSpinBox, QDoubleSpinBox, QCheckBox, QLineEdit
 
-from cuvis_ai_ui.widgets.property_editor import PropertyEditor
+from cuvis_ai_ui.widgets.property_editor import ExecutionStagesEditor, PropertyEditor
 
 
-@pytest.fixture
-def mock_node_adapter(sample_node_info):
-    """Mock CuvisNodeAdapter with hyperparameters."""
-    from cuvis_ai_ui.adapters.node_adapter import CuvisNodeAdapter
-
-    node = MagicMock(spec=CuvisNodeAdapter)
-    node.name.return_value = "MinMaxNormalizer"
-    node._cuvis_class_name = "MinMaxNormalizer"
-    node._cuvis_class_path = "cuvis_ai.node.normalization.MinMaxNormalizer"
-    node._cuvis_source = "builtin"
-    node._cuvis_plugin_name = ""
-
-    # Set hyperparameters as the dict that PropertyEditor reads directly
-    node._cuvis_hparams = {
-        "int_param": 10,
-        "float_param": 0.5,
-        "bool_param": True,
-        "str_param": "test",
+_FLOAT_CUBE_SPEC = PortSpec(dtype="float32", shape=(-1, -1, -1, -1))
+
+_BASE_NODE_ATTRS = MappingProxyType(
+    {
+        "_cuvis_source": "builtin",
+        "_cuvis_plugin_name": "",
+        "_cuvis_hparams": {},
+        "_cuvis_input_specs": {},
+        "_cuvis_output_specs": {},
+    }
+)
+
+
+def make_node(class_name, **overrides):
+    """Plain stand-in for a CuvisNodeAdapter, overriding only what a test cares about.
+
+    PropertyEditor only reads the ``_cuvis_*`` attributes and calls ``name()``,
+    ``set_name()`` and ``update_hparam()``, so a namespace is enough and avoids
+    MagicMock's child-mock machinery. ``_cuvis_class_path`` defaults to
+    ``test.<class_name>``.
+    """
+    attrs = {
+        "_cuvis_class_name": class_name,
+        "_cuvis_class_path": f"test.{class_name}",
+        **_BASE_NODE_ATTRS,
+        **overrides,
     }
+    for key in ("_cuvis_hparams", "_cuvis_input_specs", "_cuvis_output_specs"):
+        attrs[key] = dict(attrs[key])
+    node = SimpleNamespace(name=lambda: class_name, **attrs)
+    node.set_name = lambda name: setattr(node, "name", lambda: name)
+    node.update_hparam = lambda key, value: node._cuvis_hparams.__setitem__(key, value)
+    return node
 
-    # Port specs as dict[str, PortSpec]-like (PropertyEditor uses getattr with default {})
-    node._cuvis_input_specs = {}
-    node._cuvis_output_specs = {}
+
+@pytest.fixture
+def mock_node_adapter(sample_node_info):
+    """Stand-in CuvisNodeAdapter with hyperparameters."""
+    node = make_node(
+        "MinMaxNormalizer",
+        _cuvis_class_path="cuvis_ai.node.normalization.MinMaxNormalizer",
+        _cuvis_hparams={
+            "int_param": 10,
+            "float_param": 0.5,
+            "bool_param": True,
+            "str_param": "test",
+        },
+    )
 
     return node
 
 
-def test_property_editor_initialization(qapp):
+@pytest.fixture(scope="module")
+def _shared_editor(qapp):
+    editor = PropertyEditor()
+    yield editor
+    editor.setUpdatesEnabled(False)
+    editor.set_node(None)
+    editor.deleteLater()
+    qapp.processEvents()
+
+
+@pytest.fixture
+def editor(_shared_editor):
+    """Module-wide PropertyEditor, cleared back to its no-node state."""
+    _shared_editor._updating = False
+    _shared_editor.clear()
+    return _shared_editor
+
+
+def test_property_editor_initialization(qtbot):
     """Test PropertyEditor widget initialization."""
     editor = PropertyEditor()
+    qtbot.addWidget(editor)
 
     assert editor is not None
     assert editor._current_node is None
     assert len(editor._widgets) == 0
 
 
-def test_property_editor_no_node_selected(qapp):
+def test_property_editor_no_node_selected(editor):
     """Test PropertyEditor with no node selected."""
-    editor = PropertyEditor()
-
     # Header should indicate no selection
     assert "No Node Selected" in editor._header.title()
 
 
-def test_property_editor_set_node(qapp, mock_node_adapter):
+def test_property_editor_set_node(editor, mock_node_adapter):
     """Test setting a node to edit."""
-    editor = PropertyEditor()
     editor.set_node(mock_node_adapter)
 
     assert editor._current_node == mock_node_adapter
@@ -61,57 +104,51 @@ def test_property_editor_set_node(qapp, mock_node_adapter):
     assert len(editor._widgets) > 0
 
 
-def test_property_editor_creates_int_widget(qapp, mock_node_adapter):
-    """Test that PropertyEditor creates QSpinBox for int parameters."""
-    editor = PropertyEditor()
-    editor.set_node(mock_node_adapter)
-
-    # Check if int_param has a QSpinBox widget
-    assert "int_param" in editor._widgets
-    widget = editor._widgets["int_param"]
-    assert isinstance(widget, QSpinBox)
-    assert widget.value() == 10
-
+@pytest.fixture(scope="module")
+def typed_editor(qapp):
+    """PropertyEditor showing one hyperparameter of each supported type (do not mutate)."""
+    node = make_node(
+        "TypedNode",
+        _cuvis_hparams={
+            "int_param": 10,
+            "float_param": 0.5,
+            "bool_param": True,
+            "str_param": "test",
+            "items": [1, 2, 3],
+            "config": {"key": "value"},
+        },
+    )
 
-def test_property_editor_creates_float_widget(qapp, mock_node_adapter):
-    """Test that PropertyEditor creates QDoubleSpinBox for float parameters."""
     editor = PropertyEditor()
-    editor.set_node(mock_node_adapter)
-
-    # Check if float_param has a QDoubleSpinBox widget
-    assert "float_param" in editor._widgets
-    widget = editor._widgets["float_param"]
-    assert isinstance(widget, QDoubleSpinBox)
-    assert widget.value() == pytest.approx(0.5)
-
-
-def test_property_editor_creates_bool_widget(qapp, mock_node_adapter):
-    """Test that PropertyEditor creates QCheckBox for bool parameters."""
-    editor = PropertyEditor()
-    editor.set_node(mock_node_adapter)
-
-    # Check if bool_param has a QCheckBox widget
-    assert "bool_param" in editor._widgets
-    widget = editor._widgets["bool_param"]
-    assert isinstance(widget, QCheckBox)
-    assert widget.isChecked() is True
-
-
-def test_property_editor_creates_str_widget(qapp, mock_node_adapter):
-    """Test that PropertyEditor creates QLineEdit for str parameters."""
-    editor = PropertyEditor()
-    editor.set_node(mock_node_adapter)
-
-    # Check if str_param has a QLineEdit widget
-    assert "str_param" in editor._widgets
-    widget = editor._widgets["str_param"]
-    assert isinstance(widget, QLineEdit)
-    assert widget.text() == "test"
-
-
-def test_property_editor_clear(qapp, mock_node_adapter):
+    editor.set_node(node)
+    yield editor
+    editor.set_node(None)
+    editor.deleteLater()
+    qapp.processEvents()
+
+
+@pytest.mark.parametrize(
+    ("param", "widget_cls", "check"),
+    [
+        ("int_param", QSpinBox, lambda w: w.value() == 10),
+        ("float_param", QDoubleSpinBox, lambda w: w.value() == pytest.approx(0.5)),
+        ("bool_param", QCheckBox, lambda w: w.isChecked() is True),
+        ("str_param", QLineEdit, lambda w: w.text() == "test"),
+        # Lists and dicts are edited as text
+        ("items", QLineEdit, lambda w: "1" in w.text()),
+        ("config", QLineEdit, lambda w: "key" in w.text()),
+    ],
+)
+def test_property_editor_creates_typed_widget(typed_editor, param, widget_cls, check):
+    """Test that PropertyEditor picks the widget type and value from the hyperparameter."""
+    assert param in typed_editor._widgets
+    widget = typed_editor._widgets[param]
+    assert isinstance(widget, widget_cls)
+    assert check(widget)
+
+
+def test_property_editor_clear(editor, mock_node_adapter):
     """Test clearing the property editor."""
-    editor = PropertyEditor()
     editor.set_node(mock_node_adapter)
 
     assert len(editor._widgets) > 0
@@ -122,26 +159,23 @@ def test_property_editor_clear(qapp, mock_node_adapter):
     assert len(editor._widgets) == 0
 
 
-def test_property_editor_property_changed_signal(qapp, qtbot, mock_node_adapter):
+def test_property_editor_property_changed_signal(editor, qtbot, mock_node_adapter):
     """Test that property_changed signal is emitted."""
-    editor = PropertyEditor()
-
-    # Connect signal spy
-    with qtbot.waitSignal(editor.property_changed, timeout=1000) as blocker:
-        editor.set_node(mock_node_adapter)
+    editor.set_node(mock_node_adapter)
 
-        # Trigger a change (simulate user interaction)
-        if "int_param" in editor._widgets:
-            widget = editor._widgets["int_param"]
-            widget.setValue(20)
+    # Qt emits synchronously, so a short timeout only bounds a regression
+    with qtbot.waitSignal(
+        editor.property_changed,
+        timeout=100,
+        check_params_cb=lambda key, value: key == "int_param" and value == 20,
+    ):
+        editor._widgets["int_param"].setValue(20)
 
-    # Signal should have been emitted
-    assert blocker.signal_triggered
+    assert mock_node_adapter._cuvis_hparams["int_param"] == 20
 
 
-def test_property_editor_displays_node_info(qapp, mock_node_adapter):
+def test_property_editor_displays_node_info(editor, mock_node_adapter):
     """Test that PropertyEditor displays node information."""
-    editor = PropertyEditor()
     editor.set_node(mock_node_adapter)
 
     # Header should show node class name
@@ -152,26 +186,14 @@ def test_property_editor_displays_node_info(qapp, mock_node_adapter):
     assert "cuvis_ai.node.normalization.MinMaxNormalizer" in class_text
 
 
-def test_property_editor_displays_port_specs(qapp):
+def test_property_editor_displays_port_specs(editor):
     """Test that PropertyEditor displays port information."""
-    from cuvis_ai_ui.adapters.node_adapter import CuvisNodeAdapter
-    from cuvis_ai_schemas.pipeline.ports import PortSpec
-
-    node = MagicMock(spec=CuvisNodeAdapter)
-    node.name.return_value = "TestNode"
-    node._cuvis_class_name = "TestNode"
-    node._cuvis_class_path = "test.TestNode"
-    node._cuvis_source = "builtin"
-    node._cuvis_plugin_name = ""
-    node._cuvis_hparams = {}
-    node._cuvis_input_specs = {
-        "cube": PortSpec(dtype="float32", shape=(-1, -1, -1, -1)),
-    }
-    node._cuvis_output_specs = {
-        "cube": PortSpec(dtype="float32", shape=(-1, -1, -1, -1)),
-    }
+    node = make_node(
+        "TestNode",
+        _cuvis_input_specs={"cube": _FLOAT_CUBE_SPEC},
+        _cuvis_output_specs={"cube": _FLOAT_CUBE_SPEC},
+    )
 
-    editor = PropertyEditor()
     editor.set_node(node)
 
     # Ports info should show the port names
@@ -179,38 +201,24 @@ def test_property_editor_displays_port_specs(qapp):
     assert "cube" in editor._outputs_label.text()
 
 
-def test_property_editor_update_prevents_recursion(qapp, mock_node_adapter):
+def test_property_editor_update_prevents_recursion(editor, mock_node_adapter):
     """Test that property updates don't cause recursive loops."""
-    editor = PropertyEditor()
     editor.set_node(mock_node_adapter)
 
     # Set updating flag
     editor._updating = True
 
-    # Try to update a widget (should be ignored due to _updating flag)
-    if "int_param" in editor._widgets:
-        widget = editor._widgets["int_param"]
-        widget.setValue(99)
+    # Update a widget (should be ignored due to _updating flag)
+    editor._widgets["int_param"].setValue(99)
 
     # Node should not be updated during _updating=True
-    assert editor._updating is True
+    assert mock_node_adapter._cuvis_hparams["int_param"] == 10
 
 
-def test_property_editor_with_no_hyperparameters(qapp):
+def test_property_editor_with_no_hyperparameters(editor):
     """Test PropertyEditor with a node that has no hyperparameters."""
-    from cuvis_ai_ui.adapters.node_adapter import CuvisNodeAdapter
-
-    node = MagicMock(spec=CuvisNodeAdapter)
-    node.name.return_value = "SimpleNode"
-    node._cuvis_class_name = "SimpleNode"
-    node._cuvis_class_path = "test.SimpleNode"
-    node._cuvis_source = "builtin"
-    node._cuvis_plugin_name = ""
-    node._cuvis_hparams = {}
-    node._cuvis_input_specs = {}
-    node._cuvis_output_specs = {}
+    node = make_node("SimpleNode")
 
-    editor = PropertyEditor()
     editor.set_node(node)
 
     # Should only have the __name__ widget (always present)
@@ -219,204 +227,81 @@ def test_property_editor_with_no_hyperparameters(qapp):
     assert "SimpleNode" in editor._header.title()
 
 
-def test_property_editor_enum_parameter(qapp):
+def test_property_editor_enum_parameter(editor):
     """Test PropertyEditor with enum/choice parameters."""
-    from cuvis_ai_ui.adapters.node_adapter import CuvisNodeAdapter
-
-    node = MagicMock(spec=CuvisNodeAdapter)
-    node.name.return_value = "EnumNode"
-    node._cuvis_class_name = "EnumNode"
-    node._cuvis_class_path = "test.EnumNode"
-    node._cuvis_source = "builtin"
-    node._cuvis_plugin_name = ""
-    node._cuvis_hparams = {"choice": "a"}
-    node._cuvis_input_specs = {}
-    node._cuvis_output_specs = {}
+    node = make_node("EnumNode", _cuvis_hparams={"choice": "a"})
 
-    editor = PropertyEditor()
     editor.set_node(node)
 
-    # Should create a widget for the choice parameter
-    if "choice" in editor._widgets:
-        widget = editor._widgets["choice"]
-        # Could be QComboBox or QLineEdit depending on implementation
-        assert widget is not None
+    # Plain string values (no choices metadata) are edited as text
+    widget = editor._widgets["choice"]
+    assert isinstance(widget, QLineEdit)
+    assert widget.text() == "a"
 
 
-def test_property_editor_multiple_node_switches(qapp, mock_node_adapter):
+def test_property_editor_multiple_node_switches(editor, mock_node_adapter):
     """Test switching between multiple nodes."""
-    from cuvis_ai_ui.adapters.node_adapter import CuvisNodeAdapter
-
     # Create two different mock nodes
     node1 = mock_node_adapter
 
-    node2 = MagicMock(spec=CuvisNodeAdapter)
-    node2.name.return_value = "OtherNode"
-    node2._cuvis_class_name = "OtherNode"
-    node2._cuvis_class_path = "test.OtherNode"
-    node2._cuvis_source = "builtin"
-    node2._cuvis_plugin_name = ""
-    node2._cuvis_hparams = {"other_param": 42}
-    node2._cuvis_input_specs = {}
-    node2._cuvis_output_specs = {}
+    node2 = make_node("OtherNode", _cuvis_hparams={"other_param": 42})
 
-    editor = PropertyEditor()
-
-    # Set first node
-    editor.set_node(node1)
-    assert "MinMaxNormalizer" in editor._header.title()
+    # Batch both rebuilds; nothing here needs an intermediate paint
+    editor.setUpdatesEnabled(False)
+    try:
+        # Set first node
+        editor.set_node(node1)
+        assert "MinMaxNormalizer" in editor._header.title()
 
-    # Switch to second node
-    editor.set_node(node2)
-    assert "OtherNode" in editor._header.title()
+        # Switch to second node
+        editor.set_node(node2)
+        assert "OtherNode" in editor._header.title()
+    finally:
+        editor.setUpdatesEnabled(True)
 
     # Previous widgets should be replaced
-    assert "other_param" in editor._widgets or len(editor._widgets) > 0
+    assert set(editor._widgets) == {"__name__", "other_param"}
 
 
 # ---------------------------------------------------------------------------
-# Additional coverage: list, dict, path, plugin widgets
+# Additional coverage: plugin source, value parsing, refresh
 # ---------------------------------------------------------------------------
 
 
-def test_property_editor_creates_list_widget(qapp):
-    """Test that PropertyEditor creates QLineEdit for list parameters."""
-    from cuvis_ai_ui.adapters.node_adapter import CuvisNodeAdapter
-
-    node = MagicMock(spec=CuvisNodeAdapter)
-    node.name.return_value = "ListNode"
-    node._cuvis_class_name = "ListNode"
-    node._cuvis_class_path = "test.ListNode"
-    node._cuvis_source = "builtin"
-    node._cuvis_plugin_name = ""
-    node._cuvis_hparams = {"items": [1, 2, 3]}
-    node._cuvis_input_specs = {}
-    node._cuvis_output_specs = {}
-
-    editor = PropertyEditor()
-    editor.set_node(node)
-
-    assert "items" in editor._widgets
-    widget = editor._widgets["items"]
-    assert isinstance(widget, QLineEdit)
-    assert "1" in widget.text()
-
-
-def test_property_editor_creates_dict_widget(qapp):
-    """Test that PropertyEditor creates QLineEdit for dict parameters."""
-    from cuvis_ai_ui.adapters.node_adapter import CuvisNodeAdapter
-
-    node = MagicMock(spec=CuvisNodeAdapter)
-    node.name.return_value = "DictNode"
-    node._cuvis_class_name = "DictNode"
-    node._cuvis_class_path = "test.DictNode"
-    node._cuvis_source = "builtin"
-    node._cuvis_plugin_name = ""
-    node._cuvis_hparams = {"config": {"key": "value"}}
-    node._cuvis_input_specs = {}
-    node._cuvis_output_specs = {}
-
-    editor = PropertyEditor()
-    editor.set_node(node)
-
-    assert "config" in editor._widgets
-    widget = editor._widgets["config"]
-    assert isinstance(widget, QLineEdit)
-    assert "key" in widget.text()
-
-
-def test_property_editor_plugin_source_display(qapp):
+def test_property_editor_plugin_source_display(editor):
     """Test PropertyEditor shows plugin name for plugin nodes."""
-    from cuvis_ai_ui.adapters.node_adapter import CuvisNodeAdapter
-
-    node = MagicMock(spec=CuvisNodeAdapter)
-    node.name.return_value = "PluginNode"
-    node._cuvis_class_name = "PluginNode"
-    node._cuvis_class_path = "my_plugin.PluginNode"
-    node._cuvis_source = "plugin"
-    node._cuvis_plugin_name = "my_plugin"
-    node._cuvis_hparams = {}
-    node._cuvis_input_specs = {}
-    node._cuvis_output_specs = {}
+    node = make_node(
+        "PluginNode",
+        _cuvis_class_path="my_plugin.PluginNode",
+        _cuvis_source="plugin",
+        _cuvis_plugin_name="my_plugin",
+    )
 
-    editor = PropertyEditor()
     editor.set_node(node)
 
     assert "my_plugin" in editor._source_label.text()
 
 
-def test_property_editor_parse_list():
-    """Test _parse_list method directly."""
-    editor = PropertyEditor.__new__(PropertyEditor)
-
-    # Empty
-    assert editor._parse_list("") == []
-
-    # Integers
-    result = editor._parse_list("1, 2, 3")
-    assert result == [1, 2, 3]
-
-    # Floats
-    result = editor._parse_list("1.0, 2.5")
-    assert result == [1.0, 2.5]
-
-    # Strings
-    result = editor._parse_list("hello, world")
-    assert result == ["hello", "world"]
-
-
-def test_property_editor_parse_dict():
-    """Test _parse_dict method directly."""
-    editor = PropertyEditor.__new__(PropertyEditor)
-
-    # Valid JSON
-    result = editor._parse_dict('{"key": "value"}')
-    assert result == {"key": "value"}
-
-    # Invalid JSON
-    result = editor._parse_dict("not json")
-    assert result == {}
-
-
-def test_property_editor_refresh(qapp):
+def test_property_editor_refresh(editor):
     """Test refresh reloads current node."""
-    from cuvis_ai_ui.adapters.node_adapter import CuvisNodeAdapter
-
-    node = MagicMock(spec=CuvisNodeAdapter)
-    node.name.return_value = "TestNode"
-    node._cuvis_class_name = "TestNode"
-    node._cuvis_class_path = "test.TestNode"
-    node._cuvis_source = "builtin"
-    node._cuvis_plugin_name = ""
-    node._cuvis_hparams = {"param": 5}
-    node._cuvis_input_specs = {}
-    node._cuvis_output_specs = {}
+    node = make_node("TestNode", _cuvis_hparams={"param": 5})
 
-    editor = PropertyEditor()
-    editor.set_node(node)
+    # Attach the node without rendering it, so the only render is refresh()'s
+    editor._current_node = node
+    assert "param" not in editor._widgets
 
-    # Refresh should re-render
     editor.refresh()
 
     assert editor._current_node == node
     assert "param" in editor._widgets
+    assert "TestNode" in editor._header.title()
+    assert editor._updating is False
 
 
-def test_property_editor_set_none_clears(qapp):
+def test_property_editor_set_none_clears(editor):
     """Test setting node to None clears the editor."""
-    from cuvis_ai_ui.adapters.node_adapter import CuvisNodeAdapter
-
-    node = MagicMock(spec=CuvisNodeAdapter)
-    node.name.return_value = "TestNode"
-    node._cuvis_class_name = "TestNode"
-    node._cuvis_class_path = "test.TestNode"
-    node._cuvis_source = "builtin"
-    node._cuvis_plugin_name = ""
-    node._cuvis_hparams = {"p": 1}
-    node._cuvis_input_specs = {}
-    node._cuvis_output_specs = {}
+    node = make_node("TestNode", _cuvis_hparams={"p": 1})
 
-    editor = PropertyEditor()
     editor.set_node(node)
     assert len(editor._widgets) > 0
 
@@ -430,22 +315,20 @@ def test_property_editor_set_none_clears(qapp):
 # ---------------------------------------------------------------------------
 
 
-def test_execution_stages_editor_initialization(qapp):
+def test_execution_stages_editor_initialization(qtbot):
     """Test ExecutionStagesEditor initialization."""
-    from cuvis_ai_ui.widgets.property_editor import ExecutionStagesEditor
-
     editor = ExecutionStagesEditor()
+    qtbot.addWidget(editor)
 
     # Default: "always" should be checked
     stages = editor.get_stages()
     assert "always" in stages
 
 
-def test_execution_stages_editor_set_get_stages(qapp):
+def test_execution_stages_editor_set_get_stages(qtbot):
     """Test setting and getting stages."""
-    from cuvis_ai_ui.widgets.property_editor import ExecutionStagesEditor
-
     editor = ExecutionStagesEditor()
+    qtbot.addWidget(editor)
 
     editor.set_stages({"train", "inference"})
     stages = editor.get_stages()
@@ -455,12 +338,13 @@ def test_execution_stages_editor_set_get_stages(qapp):
     assert "always" not in stages
 
 
-def test_execution_stages_editor_signal(qapp, qtbot):
+def test_execution_stages_editor_signal(qtbot):
     """Test stages_changed signal emission."""
-    from cuvis_ai_ui.widgets.property_editor import ExecutionStagesEditor
-
     editor = ExecutionStagesEditor()
+    qtbot.addWidget(editor)
 
-    with qtbot.waitSignal(editor.stages_changed, timeout=1000):
+    with qtbot.waitSignal(
+        editor.stages_changed, timeout=100, check_params_cb=lambda stages: "train" in stages
+    ):
         # Toggle a checkbox
         editor._checkboxes["train"].setChecked(True)
@@ -0,0 +1,41 @@
+"""Unit tests for PropertyEditor's value parsers.
+
+These call the parsers on an uninitialised instance, so they need no QApplication
+and no widgets. Keeping them out of test_property_editor.py means none of the
+Qt fixtures are set up when only these run.
+"""
+
+from cuvis_ai_ui.widgets.property_editor import PropertyEditor
+
+
+def test_property_editor_parse_list():
+    """Test _parse_list method directly."""
+    editor = PropertyEditor.__new__(PropertyEditor)
+
+    # Empty
+    assert editor._parse_list("") == []
+
+    # Integers
+    result = editor._parse_list("1, 2, 3")
+    assert result == [1, 2, 3]
+
+    # Floats
+    result = editor._parse_list("1.0, 2.5")
+    assert result == [1.0, 2.5]
+
+    # Strings
+    result = editor._parse_list("hello, world")
+    assert result == ["hello", "world"]
+
+
+def test_property_editor_parse_dict():
+    """Test _parse_dict method directly."""
+    editor = PropertyEditor.__new__(PropertyEditor)
+
+    # Valid JSON
+    result = editor._parse_dict('{"key": "value"}')
+    assert result == {"key": "value"}
+
+    # Invalid JSON
+    result = editor._parse_dict("not json")
+    assert result == {}